@@ -0,0 +1,60 @@
+"""
+Numeric kernels for the Network Optimization Agent
+Compiled with Numba when it is installed, otherwise plain NumPy array expressions
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        def decorator(func):
+            return func
+        return decorator
+
+EARTH_RADIUS_KM = 6371.0
+
+# Labels indexed by the codes returned from congestion_level()
+CONGESTION_LABELS = ("Low", "Medium", "High")
+
+@njit(cache=True)
+def path_reliability(hops):
+    """Reliability per path; base reliability decreases with hop count"""
+    return 0.99 ** hops
+
+@njit(cache=True)
+def path_cost(distances, hops):
+    """Cost index per path; increases with distance and node count"""
+    return distances * 0.01 + (hops + 1) * 10.0
+
+@njit(cache=True)
+def congestion_level(hops):
+    """Congestion code per path: 0 for <= 1 hop, 1 for <= 3 hops, 2 beyond"""
+    return (hops > 1).astype(np.int8) + (hops > 3).astype(np.int8)
+
+@njit(cache=True)
+def haversine_km(lat1, lon1, lat2, lon2):
+    """Great-circle distance in km; any argument may be an array"""
+    lat1_rad = np.radians(lat1)
+    lat2_rad = np.radians(lat2)
+    dlat = lat2_rad - lat1_rad
+    dlon = np.radians(lon2 - lon1)
+    
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1_rad) * np.cos(lat2_rad) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+@njit(cache=True)
+def utilization_metrics(utilizations):
+    """(average, max, efficiency) for a non-empty array of station utilizations"""
+    peak = utilizations.max()
+    return utilizations.mean(), peak, 100.0 - (peak - utilizations.min())
+
+@njit(cache=True)
+def load_stats(loads):
+    """(mean, standard deviation) for a non-empty array of station loads"""
+    return loads.mean(), loads.std()
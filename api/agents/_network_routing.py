@@ -0,0 +1,198 @@
+"""
+Graph routines for the Network Optimization Agent
+Shortest, K-shortest and single-source paths over the ground-station link graph
+"""
+
+import heapq
+import math
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Set, Tuple
+import numpy as np
+from ._network_kernels import haversine_km
+
+# (distance matrix, adjacency lists of (neighbour, km)) indexed by node position
+RouteGraph = Tuple[List[List[float]], List[List[Tuple[int, float]]]]
+
+@lru_cache(maxsize=32)
+def build_route_graph(coords: Tuple[Tuple[float, float], ...],
+                      max_link_km: Optional[float] = None) -> RouteGraph:
+    """Build the link graph for a node set, weighted by great-circle distance
+
+    Every pair of nodes is linked unless max_link_km is given, in which case
+    longer links are dropped. Results are cached per node set, so callers must
+    treat the returned lists as read-only.
+    """
+    points = np.asarray(coords, dtype=np.float64).reshape(-1, 2)
+    lats, lons = points[:, 0], points[:, 1]
+    distances = haversine_km(lats[:, None], lons[:, None], lats[None, :], lons[None, :])
+
+    linked = ~np.eye(len(points), dtype=bool)
+    if max_link_km is not None:
+        linked &= distances <= max_link_km
+
+    weights = distances.tolist()
+    adjacency = [
+        [(v, weights[u][v]) for v in np.flatnonzero(row).tolist()]
+        for u, row in enumerate(linked)
+    ]
+    return weights, adjacency
+
+@lru_cache(maxsize=32)
+def component_labels(coords: Tuple[Tuple[float, float], ...],
+                     max_link_km: Optional[float] = None) -> Tuple[int, ...]:
+    """Connected-component label per node of the link graph for a node set
+
+    Two nodes are mutually reachable exactly when their labels match, so
+    repeated queries against the same node set are a tuple lookup.
+    """
+    _, adjacency = build_route_graph(coords, max_link_km)
+    labels = [-1] * len(adjacency)
+    for root in range(len(adjacency)):
+        if labels[root] >= 0:
+            continue
+        labels[root] = root
+        stack = [root]
+        while stack:
+            u = stack.pop()
+            for v, _ in adjacency[u]:
+                if labels[v] < 0:
+                    labels[v] = root
+                    stack.append(v)
+    return tuple(labels)
+
+def shortest_path(graph: RouteGraph, source: int, target: int,
+                  banned_nodes: FrozenSet[int] = frozenset(),
+                  banned_edges: FrozenSet[Tuple[int, int]] = frozenset()) -> Optional[Tuple[float, List[int]]]:
+    """Bidirectional A* between source and target over the undirected link graph
+
+    Searches forward from source and backward from target, always expanding
+    the cheaper frontier, and stops once the two frontiers together cannot
+    beat the best meeting point. Only the path through that meeting node is
+    reconstructed.
+
+    Links are weighted by great-circle distance, so the straight-line distance
+    to either endpoint (already in the distance matrix) is an admissible,
+    consistent heuristic. Both searches share the averaged potential
+    (h_target - h_source) / 2, which keeps reduced link costs non-negative and
+    steers expansion towards the other endpoint.
+    """
+    if source == target:
+        return 0.0, [source]
+
+    weights, adjacency = graph
+    potential = [(row[target] - row[source]) * 0.5 for row in weights]
+    dists = ({source: 0.0}, {target: 0.0})
+    preds: Tuple[dict, dict] = ({}, {})
+    settled: Tuple[Set[int], Set[int]] = (set(), set())
+    heaps = ([(0.0, source)], [(0.0, target)])
+    best, meet = math.inf, None
+
+    while heaps[0] and heaps[1]:
+        if heaps[0][0][0] + heaps[1][0][0] >= best:
+            break
+        side = 0 if heaps[0][0][0] <= heaps[1][0][0] else 1
+        d, u = heapq.heappop(heaps[side])
+        if u in settled[side]:
+            continue
+        settled[side].add(u)
+
+        dist, other, pred = dists[side], dists[1 - side], preds[side]
+        sign = 1.0 if side == 0 else -1.0
+        for v, w in adjacency[u]:
+            if v in banned_nodes:
+                continue
+            # The backward search walks links against their direction
+            if ((u, v) if side == 0 else (v, u)) in banned_edges:
+                continue
+            nd = d + w + sign * (potential[v] - potential[u])
+            if nd < dist.get(v, math.inf):
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heaps[side], (nd, v))
+                if v in other and nd + other[v] < best:
+                    best, meet = nd + other[v], v
+
+    if meet is None:
+        return None
+
+    path = [meet]
+    while path[-1] != source:
+        path.append(preds[0][path[-1]])
+    path.reverse()
+    while path[-1] != target:
+        path.append(preds[1][path[-1]])
+    return sum(weights[u][v] for u, v in zip(path, path[1:])), path
+
+def k_shortest_paths(graph: RouteGraph, source: int, target: int, k: int) -> List[Tuple[float, List[int]]]:
+    """Yen's algorithm: up to k loopless paths in order of increasing length"""
+    weights, _ = graph
+    first = shortest_path(graph, source, target)
+    if first is None:
+        return []
+
+    accepted = [first]
+    candidates: List[Tuple[float, List[int]]] = []
+    seen = {tuple(first[1])}
+
+    while len(accepted) < k:
+        _, last_path = accepted[-1]
+        root_cost = 0.0
+        for i in range(len(last_path) - 1):
+            spur_node = last_path[i]
+            root = last_path[:i + 1]
+
+            # Block the next edge of every accepted path sharing this root,
+            # and every root node except the spur so paths stay loopless
+            banned_edges = frozenset(
+                (path[i], path[i + 1]) for _, path in accepted
+                if len(path) > i + 1 and path[:i + 1] == root
+            )
+            spur = shortest_path(graph, spur_node, target, frozenset(root[:-1]), banned_edges)
+            if spur is not None:
+                path = root[:-1] + spur[1]
+                key = tuple(path)
+                if key not in seen:
+                    seen.add(key)
+                    heapq.heappush(candidates, (root_cost + spur[0], path))
+
+            root_cost += weights[last_path[i]][last_path[i + 1]]
+
+        if not candidates:
+            break
+        accepted.append(heapq.heappop(candidates))
+
+    return accepted
+
+def shortest_path_tree(graph: RouteGraph, source: int) -> Tuple[List[float], List[int]]:
+    """Dijkstra from source to every node
+
+    Returns (distances, predecessors) indexed by node; unreachable nodes have
+    an infinite distance and predecessor -1, as does the source itself.
+    """
+    _, adjacency = graph
+    dist = [math.inf] * len(adjacency)
+    pred = [-1] * len(adjacency)
+    dist[source] = 0.0
+    heap = [(0.0, source)]
+
+    while heap:
+        d, u = heapq.heappop(heap)
+        if d > dist[u]:
+            continue
+        for v, w in adjacency[u]:
+            nd = d + w
+            if nd < dist[v]:
+                dist[v] = nd
+                pred[v] = u
+                heapq.heappush(heap, (nd, v))
+
+    return dist, pred
+
+def tree_path(pred: List[int], source: int, target: int) -> Optional[List[int]]:
+    """Walk a predecessor list back from target; None when target is unreachable"""
+    if target != source and pred[target] < 0:
+        return None
+    path = [target]
+    while path[-1] != source:
+        path.append(pred[path[-1]])
+    return path[::-1]
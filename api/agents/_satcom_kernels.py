@@ -0,0 +1,70 @@
+"""
+Numeric kernels for the SATCOM Operations Expert Agent
+Compiled with Numba when it is installed, otherwise plain NumPy array expressions
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that returns the function unchanged"""
+        def decorator(func):
+            return func
+        return decorator
+
+# Link-budget model terms are shared with the scalar path in satcom_expert,
+# which has finished loading by the time the agent imports this module
+from .satcom_expert import (
+    EB_N0_CORRECTION_DB,
+    FSPL_CONSTANT_DB,
+    NOISE_POWER_DBW,
+    REQUIRED_EB_N0_DB
+)
+
+@njit(cache=True)
+def link_budget(frequency_ghz, distance_km, tx_power_dbm, tx_gain_dbi, rx_gain_dbi, rain_margin_db):
+    """(path loss, EIRP, received power dBm, C/N, Eb/N0, link margin) per link; any argument may be an array
+
+    Same model as SATCOMExpertAgent.calculate_link_budget: 290 K system
+    temperature, 36 MHz transponder, 50 Mbps QPSK carrier and a 10 dB Eb/N0
+    requirement. Intermediate terms are updated in place, so array inputs
+    cost one temporary per output rather than one per operation.
+    """
+    fspl_db = np.log10(distance_km * frequency_ghz)
+    fspl_db *= 20
+    fspl_db += FSPL_CONSTANT_DB
+    eirp_dbw = tx_power_dbm - 30
+    eirp_dbw += tx_gain_dbi
+    rx_power_dbw = eirp_dbw - fspl_db
+    rx_power_dbw += rx_gain_dbi
+    rx_power_dbw -= rain_margin_db
+    cn_ratio_db = rx_power_dbw - NOISE_POWER_DBW
+    eb_n0_db = cn_ratio_db - EB_N0_CORRECTION_DB
+    return fspl_db, eirp_dbw, rx_power_dbw + 30, cn_ratio_db, eb_n0_db, eb_n0_db - REQUIRED_EB_N0_DB
+
+@njit(cache=True)
+def link_status_level(link_margin_db):
+    """Link status code per margin: 0 for <= 0 dB, 1 for <= 3 dB, 2 beyond
+
+    Indexes SATCOMExpertAgent's LINK_STATUS_LABELS; written as comparisons
+    rather than np.searchsorted so that NaN margins rate as Poor.
+    """
+    return (link_margin_db > 0).astype(np.int8) + (link_margin_db > 3).astype(np.int8)
+
+@njit(cache=True)
+def pass_visibility_minutes(orbital_period_min, inclination, latitudes):
+    """Rough average visibility per pass for ground stations at the given latitudes"""
+    return orbital_period_min * 0.15 * np.cos(np.radians(np.abs(latitudes - inclination)))
+
+@njit(cache=True)
+def coverage_quality_level(inclination, latitudes):
+    """Coverage quality code per latitude: 0 within the inclination, 1 within 20 degrees beyond it, 2 otherwise"""
+    abs_lat = np.abs(latitudes)
+    outside = ~(inclination >= abs_lat)
+    nearby = np.abs(inclination - abs_lat) < 20
+    return outside.astype(np.int8) * (2 - nearby.astype(np.int8))
@@ -4,11 +4,28 @@ Base Agent implementation using CrewAI
 
 from crewai import Agent, Task, Crew
 from langchain_community.llms import OpenAI
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, FrozenSet, List, Sequence, Tuple
 import os
 import json
+import importlib
+import re
+import threading
+from itertools import combinations
+from types import MappingProxyType
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+try:
+    import hyperscan
+    HAS_HYPERSCAN = True
+except ImportError:
+    HAS_HYPERSCAN = False
+
 # Load environment variables
 load_dotenv()
 
@@ -34,6 +51,103 @@ except Exception as e:
     GERS_INDEX_DATA = {}
     GERS_NAME_TO_ID = {}
 
+# Heavy numeric modules are imported on first use and cached here, so agent
+# construction at worker boot stays dominated by CrewAI itself
+_LAZY_MODULES: Dict[str, Any] = {}
+
+def lazy_import(name: str):
+    """Import a module on first use and return the cached handle thereafter"""
+    module = _LAZY_MODULES.get(name)
+    if module is None:
+        module = _LAZY_MODULES[name] = importlib.import_module(name)
+    return module
+
+def serialize_result(result: Dict[str, Any]) -> str:
+    """Indented JSON text for an agent's analysis result, encoded by orjson when it is installed"""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+        except orjson.JSONEncodeError:
+            pass
+    return json.dumps(result, indent=2)
+
+def compile_keyword_scanner(keywords: Sequence[str], ids: Sequence[int], on_match: Callable,
+                            caseless: bool = False) -> Callable[[str, Any], None]:
+    """Compile literal keywords into one Hyperscan database; requires HAS_HYPERSCAN
+    
+    The returned scan(text, context) reports each keyword at most once per
+    scan, calling on_match(id, start, end, flags, context). Hyperscan scratch
+    space can't be shared by concurrent scans, so each thread gets its own.
+    """
+    flags = hyperscan.HS_FLAG_SINGLEMATCH
+    if caseless:
+        flags |= hyperscan.HS_FLAG_CASELESS
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[keyword.encode() for keyword in keywords],
+        ids=list(ids),
+        elements=len(keywords),
+        flags=flags
+    )
+    local = threading.local()
+    
+    def scan(text: str, context: Any) -> None:
+        scratch = getattr(local, "scratch", None)
+        if scratch is None:
+            scratch = local.scratch = hyperscan.Scratch(database)
+        database.scan(text.encode("utf-8", "surrogatepass"),
+                      match_event_handler=on_match, context=context, scratch=scratch)
+    
+    return scan
+
+def build_keyword_classifier(terms: Sequence[str],
+                             rules: Sequence[Tuple[str, Sequence[FrozenSet[str]]]]) -> Callable[[str], Optional[str]]:
+    """Classifier from a lower-cased task to the first intent in rules whose keywords all occur in it
+    
+    rules lists intents in priority order, each with alternative keyword sets
+    drawn from terms. Every combination of terms is resolved up front, so
+    classifying is one scan for the keywords present (Hyperscan when installed,
+    else a regex with a zero-width lookahead so overlapping keywords are all
+    reported) and one frozenset hash lookup.
+    """
+    def resolve(found: FrozenSet[str]) -> Optional[str]:
+        for intent, alternatives in rules:
+            if any(keywords <= found for keywords in alternatives):
+                return intent
+        return None
+    
+    intent_by_keywords = MappingProxyType({
+        frozenset(combo): resolve(frozenset(combo))
+        for size in range(len(terms) + 1)
+        for combo in combinations(terms, size)
+    })
+    
+    if HAS_HYPERSCAN:
+        def collect(term_id: int, start: int, end: int, flags: int, found: set) -> None:
+            found.add(terms[term_id])
+        
+        scan = compile_keyword_scanner(terms, range(len(terms)), collect)
+        
+        def classify(task_lower: str) -> Optional[str]:
+            found: set = set()
+            scan(task_lower, found)
+            return intent_by_keywords[frozenset(found)]
+    else:
+        pattern = re.compile("(?=(%s))" % "|".join(map(re.escape, terms)))
+        
+        def classify(task_lower: str) -> Optional[str]:
+            return intent_by_keywords[frozenset(m.group(1) for m in pattern.finditer(task_lower))]
+    
+    return classify
+
+class FallbackReply(str):
+    """Canned reply returned in place of an answer the agent could not produce
+    
+    Behaves as the plain reply text; callers check for the type to avoid
+    caching or otherwise reusing a reply that only reflects a transient failure.
+    """
+    __slots__ = ()
+
 class BaseCrewAgent:
     """Base class for all CrewAI agents"""
     
@@ -354,7 +468,10 @@ class BaseCrewAgent:
             # Create context string for the agent
             context_str = ""
             if context:
-                context_str = f"\nContext: {context}"
+                # Static capability layers hold tuples; render them as the lists callers send
+                rendered = {key: list(value) if isinstance(value, tuple) else value
+                            for key, value in context.items()}
+                context_str = f"\nContext: {rendered}"
             
             # Create a CrewAI task
             task = Task(
@@ -394,7 +511,7 @@ class BaseCrewAgent:
                 # Log the error for debugging
                 print(f"CrewAI execution error: {str(crew_error)}")
                 # Return a helpful response instead of failing
-                return f"I understand you're asking about '{task_description}'. Let me provide a brief response: As your {self.role}, I can help analyze this topic. Could you be more specific about what aspect you'd like me to focus on?"
+                return FallbackReply(f"I understand you're asking about '{task_description}'. Let me provide a brief response: As your {self.role}, I can help analyze this topic. Could you be more specific about what aspect you'd like me to focus on?")
             
         except Exception as e:
             print(f"Agent execution error: {str(e)}")
@@ -406,24 +523,24 @@ class BaseCrewAgent:
             if any(phrase in task_lower for phrase in ["is this working", "working", "hello", "hi"]):
                 if capabilities:
                     cap_list = ", ".join(capabilities[:3])
-                    return f"Yes, I'm working perfectly! I'm your {self.role} and I can help you with {cap_list}, and much more. What would you like to analyze?"
+                    return FallbackReply(f"Yes, I'm working perfectly! I'm your {self.role} and I can help you with {cap_list}, and much more. What would you like to analyze?")
                 else:
-                    return f"Hello! I'm your {self.role} and I'm fully operational. I'm here to provide expert analysis and insights. What can I help you with today?"
+                    return FallbackReply(f"Hello! I'm your {self.role} and I'm fully operational. I'm here to provide expert analysis and insights. What can I help you with today?")
             
             elif any(phrase in task_lower for phrase in ["what can you", "what do you", "help me", "capabilities"]):
                 if capabilities:
                     cap_text = "\n• ".join(capabilities)
-                    return f"I'm your {self.role} and I specialize in:\n• {cap_text}\n\nI can provide detailed analysis, answer questions, and offer strategic recommendations in these areas. What specific analysis would you like me to perform?"
+                    return FallbackReply(f"I'm your {self.role} and I specialize in:\n• {cap_text}\n\nI can provide detailed analysis, answer questions, and offer strategic recommendations in these areas. What specific analysis would you like me to perform?")
                 else:
-                    return f"As your {self.role}, I can provide expert analysis, insights, and recommendations. I'm designed to help you make informed decisions with data-driven analysis. What would you like to explore?"
+                    return FallbackReply(f"As your {self.role}, I can provide expert analysis, insights, and recommendations. I'm designed to help you make informed decisions with data-driven analysis. What would you like to explore?")
             
             elif any(phrase in task_lower for phrase in ["and", "more", "continue", "go on", "what else"]):
-                return f"I'd be happy to continue! As your {self.role}, I can dive deeper into any analysis or explore related topics. What specific aspect would you like me to focus on next?"
+                return FallbackReply(f"I'd be happy to continue! As your {self.role}, I can dive deeper into any analysis or explore related topics. What specific aspect would you like me to focus on next?")
             
             else:
                 # More concise, clarifying response
                 if len(task_description.strip()) < 10:  # Very short queries
-                    return f"Could you clarify what you'd like me to analyze? I'm your {self.role} and can help with specific questions."
+                    return FallbackReply(f"Could you clarify what you'd like me to analyze? I'm your {self.role} and can help with specific questions.")
                 else:
                     # Ask for clarification professionally
-                    return f"I need more context to help effectively. What specific analysis would you like regarding '{task_description}'?"
\ No newline at end of file
+                    return FallbackReply(f"I need more context to help effectively. What specific analysis would you like regarding '{task_description}'?")
\ No newline at end of file
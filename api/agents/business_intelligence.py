@@ -8,7 +8,15 @@ from typing import Optional, Dict, Any, List, Tuple
 import math
 import json
 from datetime import datetime, timedelta
-from .base_agent import BaseCrewAgent
+from .base_agent import BaseCrewAgent, FallbackReply
+
+# Reply returned in place of an analysis that failed
+ANALYSIS_ERROR_REPLY = FallbackReply(
+    "I apologize, but I encountered an issue while analyzing your request. As your Business "
+    "Intelligence analyst, I'm here to help with market analysis, revenue optimization, customer "
+    "insights, and strategic planning. Could you please rephrase your question or let me know what "
+    "specific business analysis you'd like me to perform?"
+)
 
 class BusinessIntelligenceAgent(BaseCrewAgent):
     """Expert agent for business intelligence and strategic analysis"""
@@ -916,5 +924,5 @@ class BusinessIntelligenceAgent(BaseCrewAgent):
                 # Use parent class LLM execution for natural language response
                 return super().execute(task, enhanced_context)
                 
-        except Exception as e:
-            return f"I apologize, but I encountered an issue while analyzing your request. As your Business Intelligence analyst, I'm here to help with market analysis, revenue optimization, customer insights, and strategic planning. Could you please rephrase your question or let me know what specific business analysis you'd like me to perform?"
\ No newline at end of file
+        except Exception:
+            return ANALYSIS_ERROR_REPLY
\ No newline at end of file
@@ -7,7 +7,21 @@ from crewai import Agent
 from typing import Optional, Dict, Any, List, Tuple
 import math
 import json
-from .base_agent import BaseCrewAgent
+from .base_agent import BaseCrewAgent, FallbackReply, lazy_import
+
+EARTH_RADIUS_KM = 6371.0
+
+# Fleets larger than this are clustered with a matrix formulation instead of
+# the pairwise Python loop
+LARGE_FLEET_THRESHOLD = 1024
+
+# Reply returned in place of an analysis that failed
+ANALYSIS_ERROR_REPLY = FallbackReply(
+    "I apologize for the technical difficulty. As your Geospatial Analyst, I specialize in analyzing "
+    "ground station locations, coverage patterns, and spatial relationships. I can help you with "
+    "coverage optimization, site selection, terrain analysis, and geographic insights. What specific "
+    "geospatial analysis would you like me to perform?"
+)
 
 class GeospatialAnalystAgent(BaseCrewAgent):
     """Expert agent for geospatial analytics and coverage optimization"""
@@ -29,6 +43,11 @@ class GeospatialAnalystAgent(BaseCrewAgent):
             allow_delegation=False,
             tools=[]
         )
+    
+    @classmethod
+    def warmup(cls) -> None:
+        """Import the numeric modules used by the large-fleet paths ahead of the first query"""
+        lazy_import("numpy")
         
     def analyze_coverage_gaps(self, stations: List[Dict]) -> Dict[str, Any]:
         """Analyze coverage gaps in the ground station network"""
@@ -172,27 +191,35 @@ class GeospatialAnalystAgent(BaseCrewAgent):
         clustered = []
         cluster_threshold_km = 200  # Stations within 200km are considered clustered
         
-        for i, station1 in enumerate(stations):
-            if i in clustered:
-                continue
-                
-            cluster = [station1]
-            lat1 = station1.get("location", {}).get("latitude", 0)
-            lon1 = station1.get("location", {}).get("longitude", 0)
-            
-            for j, station2 in enumerate(stations[i+1:], i+1):
-                if j in clustered:
+        if len(stations) > LARGE_FLEET_THRESHOLD:
+            groups = self._cluster_large_fleet(stations, cluster_threshold_km)
+        else:
+            groups = []
+            for i, station1 in enumerate(stations):
+                if i in clustered:
                     continue
                     
-                lat2 = station2.get("location", {}).get("latitude", 0)
-                lon2 = station2.get("location", {}).get("longitude", 0)
+                cluster = [station1]
+                lat1 = station1.get("location", {}).get("latitude", 0)
+                lon1 = station1.get("location", {}).get("longitude", 0)
                 
-                distance = self._haversine_distance(lat1, lon1, lat2, lon2)
+                for j, station2 in enumerate(stations[i+1:], i+1):
+                    if j in clustered:
+                        continue
+                        
+                    lat2 = station2.get("location", {}).get("latitude", 0)
+                    lon2 = station2.get("location", {}).get("longitude", 0)
+                    
+                    distance = self._haversine_distance(lat1, lon1, lat2, lon2)
+                    
+                    if distance <= cluster_threshold_km:
+                        cluster.append(station2)
+                        clustered.append(j)
                 
-                if distance <= cluster_threshold_km:
-                    cluster.append(station2)
-                    clustered.append(j)
-            
+                groups.append(cluster)
+        
+        for cluster in groups:
+            station1 = cluster[0]
             if len(cluster) > 1:
                 clusters["clusters_identified"].append({
                     "size": len(cluster),
@@ -274,6 +301,47 @@ class GeospatialAnalystAgent(BaseCrewAgent):
         
         return R * c
     
+    def _unit_vectors(self, stations: List[Dict]) -> "np.ndarray":
+        """Convert station lat/lon to unit 3-vectors on the sphere"""
+        np = lazy_import("numpy")
+        lat = np.radians(np.fromiter((s.get("location", {}).get("latitude", 0) for s in stations),
+                                     dtype=np.float64, count=len(stations)))
+        lon = np.radians(np.fromiter((s.get("location", {}).get("longitude", 0) for s in stations),
+                                     dtype=np.float64, count=len(stations)))
+        cos_lat = np.cos(lat)
+        return np.column_stack([cos_lat * np.cos(lon), cos_lat * np.sin(lon), np.sin(lat)])
+    
+    def _cluster_large_fleet(self, stations: List[Dict], threshold_km: float,
+                             block_size: int = 1024) -> List[List[Dict]]:
+        """Proximity clustering for large fleets using a BLAS-backed adjacency matrix
+        
+        Two unit vectors a, b are within great-circle distance d of each other
+        exactly when a.b >= cos(d / R), so the pairwise haversine test reduces to
+        a matrix product. The greedy sweep below matches the per-pair loop in
+        cluster_analysis station for station.
+        """
+        np = lazy_import("numpy")
+        n = len(stations)
+        X = self._unit_vectors(stations)
+        min_dot = math.cos(threshold_km / EARTH_RADIUS_KM)
+        
+        # Build the boolean adjacency in row blocks to bound peak memory
+        adjacency = np.empty((n, n), dtype=bool)
+        for start in range(0, n, block_size):
+            stop = min(start + block_size, n)
+            np.greater_equal(X[start:stop] @ X.T, min_dot, out=adjacency[start:stop])
+        
+        clustered = np.zeros(n, dtype=bool)
+        groups = []
+        for i in range(n):
+            if clustered[i]:
+                continue
+            members = np.flatnonzero(adjacency[i, i + 1:] & ~clustered[i + 1:]) + i + 1
+            clustered[members] = True
+            groups.append([stations[i]] + [stations[j] for j in members])
+        
+        return groups
+    
     def _calculate_horizon_distance(self, height_meters: float) -> float:
         """Calculate horizon distance based on antenna height"""
         # Simplified formula: d = sqrt(2 * R * h) where R is Earth's radius
@@ -385,5 +453,5 @@ class GeospatialAnalystAgent(BaseCrewAgent):
                 # Use parent class LLM execution for natural language response
                 return super().execute(task, enhanced_context)
                 
-        except Exception as e:
-            return f"I apologize for the technical difficulty. As your Geospatial Analyst, I specialize in analyzing ground station locations, coverage patterns, and spatial relationships. I can help you with coverage optimization, site selection, terrain analysis, and geographic insights. What specific geospatial analysis would you like me to perform?"
\ No newline at end of file
+        except Exception:
+            return ANALYSIS_ERROR_REPLY
\ No newline at end of file
@@ -4,15 +4,239 @@ Specializes in network capacity planning, traffic routing, and performance optim
 """
 
 from crewai import Agent
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Callable, List, Mapping, Tuple, Union
+from collections import ChainMap, Counter, OrderedDict
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+import hashlib
 import math
 import json
-import random
-from .base_agent import BaseCrewAgent
+from .base_agent import BaseCrewAgent, FallbackReply, build_keyword_classifier, lazy_import, serialize_result
+
+@dataclass
+class TrafficMatrix:
+    """Station-to-station traffic in struct-of-arrays layout
+    
+    values[i, j] is the load in Gbps from names[i] to names[j]. Pairs without
+    a traffic entry, including the diagonal, hold NaN.
+    """
+    names: List[str]
+    values: "np.ndarray"
+    
+    @classmethod
+    def from_dict(cls, traffic: Dict[str, float]) -> "TrafficMatrix":
+        """Build from the {"src->dst": gbps} mapping accepted by the public API"""
+        np = lazy_import("numpy")
+        index: Dict[str, int] = {}
+        rows, cols = [], []
+        for key in traffic:
+            src, _, dst = key.partition("->")
+            rows.append(index.setdefault(src, len(index)))
+            cols.append(index.setdefault(dst, len(index)))
+        
+        values = np.full((len(index), len(index)), np.nan)
+        values[rows, cols] = np.fromiter(traffic.values(), dtype=np.float64, count=len(traffic))
+        return cls(list(index), values)
+    
+    def label(self, i: int, j: int) -> str:
+        """Format the "src->dst" path label for a single pair"""
+        return f"{self.names[i]}->{self.names[j]}"
+
+# QoS class requirements, shared read-only across calls
+QOS_PRIORITIES = MappingProxyType({
+    "real_time": MappingProxyType({"priority": 1, "latency_req_ms": 50, "jitter_req_ms": 5}),
+    "mission_critical": MappingProxyType({"priority": 2, "latency_req_ms": 100, "jitter_req_ms": 20}),
+    "business": MappingProxyType({"priority": 3, "latency_req_ms": 200, "jitter_req_ms": 50}),
+    "bulk": MappingProxyType({"priority": 4, "latency_req_ms": 1000, "jitter_req_ms": 200})
+})
+QOS_PRIORITY_RANK = MappingProxyType({name: spec["priority"] for name, spec in QOS_PRIORITIES.items()})
+
+# Keywords looked for in a task
+TASK_TERMS = ("topology", "capacity", "planning", "load", "balanc", "routing", "qos", "quality", "cost")
+
+# Intents in dispatch priority order, each with alternative keyword sets that
+# must all be present in the task
+TASK_RULES = (
+    ("topology", (frozenset({"topology"}),)),
+    ("capacity", (frozenset({"capacity", "planning"}),)),
+    ("load_balancing", (frozenset({"load", "balanc"}),)),
+    ("routing", (frozenset({"routing"}),)),
+    ("qos", (frozenset({"qos"}), frozenset({"quality"}))),
+    ("cost", (frozenset({"cost"}),)),
+)
+
+def _dispatch_entry(method_name: str, required: Tuple[str, ...],
+                    optional: Tuple[Tuple[str, Any], ...], missing_message: str) -> Tuple[str, Callable, str]:
+    """Bundle a handler with a one-pass extractor for its positional arguments
+    
+    The extractor reads every required key with a single itemgetter call,
+    raising KeyError if one is absent, then fills optional keys with defaults.
+    """
+    get_required = itemgetter(*required)
+    
+    def extract(context: Mapping[str, Any]) -> Tuple[Any, ...]:
+        values = get_required(context)
+        if len(required) == 1:
+            values = (values,)
+        return (*values, *(context.get(key, default) for key, default in optional))
+    
+    return method_name, extract, missing_message
+
+# intent -> (handler, argument extractor, reply when a required key is missing)
+TASK_DISPATCH = MappingProxyType({
+    "topology": _dispatch_entry("optimize_network_topology", ("stations",), (("traffic_matrix", None),),
+                                "Please provide station data for topology optimization"),
+    "capacity": _dispatch_entry("capacity_planning_analysis", ("current_demand",),
+                                (("growth_rate", 0.15), ("planning_horizon", 3)),
+                                "Please provide current demand data for capacity planning"),
+    "load_balancing": _dispatch_entry("load_balancing_optimization", ("stations",), (("traffic_load", {}),),
+                                      "Please provide station and traffic data for load balancing"),
+    "routing": _dispatch_entry("routing_optimization", ("source", "destination"),
+                               (("intermediate_nodes", []), ("constraints", None)),
+                               "Please provide source and destination for routing optimization"),
+    "routing_batch": _dispatch_entry("batch_routing_optimization", ("pairs",),
+                                     (("intermediate_nodes", []), ("constraints", None)),
+                                     "Please provide source/destination pairs for batch routing"),
+    "qos": _dispatch_entry("qos_optimization", ("traffic_classes",), (("bandwidth_gbps", 10),),
+                           "Please provide traffic classes for QoS optimization"),
+    "cost": _dispatch_entry("cost_optimization_analysis", ("network_costs",),
+                            (("utilization_data", {}), ("optimization_target", "balanced")),
+                            "Please provide cost data for optimization analysis")
+})
+
+# Classifies a lower-cased task with one keyword scan and a table lookup
+_classify_task = build_keyword_classifier(TASK_TERMS, TASK_RULES)
+
+# Capacity investment recommendation for planning years 1, 2 and 3+
+INVESTMENT_STAGES = (
+    "Immediate: Upgrade existing infrastructure",
+    "Mid-term: Add redundant capacity",
+    "Long-term: New station deployment"
+)
+
+# Serialized analysis responses kept per agent
+RESPONSE_CACHE_SIZE = 256
+
+# Errors an analysis raises on malformed context data (missing fields, wrong types, empty inputs)
+ANALYSIS_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError, ZeroDivisionError)
+
+# Reply returned in place of an analysis that failed on malformed context
+ANALYSIS_ERROR_REPLY = FallbackReply(
+    "I apologize for the technical difficulty. As your Network Optimizer, I specialize in designing "
+    "efficient network topologies, optimizing capacity and performance, and ensuring cost-effective "
+    "resource utilization. I can help you with traffic analysis, bandwidth planning, and performance "
+    "optimization. What specific network optimization would you like me to analyze?"
+)
+
+# Shared empty layer for ChainMap views when the caller passes no context
+_EMPTY_CONTEXT = MappingProxyType({})
+
+def _request_digest(intent: str, args: Tuple[Any, ...]) -> Optional[bytes]:
+    """Stable 16-byte key for an analysis request, or None if the arguments aren't JSON data"""
+    try:
+        canonical = json.dumps([intent, args], sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+TOPOLOGY_CACHE_SIZE = 64
+
+def _topology_digest(stations: List[Dict], traffic: TrafficMatrix) -> Optional[bytes]:
+    """Stable 16-byte key for a station set and traffic matrix, or None if stations aren't JSON data"""
+    np = lazy_import("numpy")
+    try:
+        canonical = json.dumps([stations, traffic.names], sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    digest = hashlib.blake2b(canonical.encode(), digest_size=16)
+    digest.update(np.ascontiguousarray(traffic.values, dtype=np.float64).tobytes())
+    return digest.digest()
+
+def _water_fill(unmet: "np.ndarray", budget: float) -> "np.ndarray":
+    """Grants min(unmet, level) per class, with the level chosen so the grants use up the budget
+    
+    Solved in closed form: with demands sorted ascending, raising the level to
+    the i-th demand costs the demands below it plus that demand for every
+    class from i on. The first level that exceeds the budget brackets the
+    answer, and the level inside the bracket is a single division.
+    """
+    np = lazy_import("numpy")
+    unmet = np.maximum(unmet, 0.0)
+    levels = np.sort(unmet)
+    below = np.concatenate(([0.0], np.cumsum(levels)[:-1]))
+    remaining_classes = np.arange(len(levels), 0, -1)
+    cost = below + levels * remaining_classes
+    
+    i = int(np.searchsorted(cost, budget))
+    if i == len(levels):
+        return unmet  # Budget covers every demand
+    level = (budget - below[i]) / remaining_classes[i]
+    return np.minimum(unmet, level)
+
+@dataclass(slots=True, frozen=True)
+class PathEvaluation:
+    """Scored candidate route; converted to a dict only when serialized"""
+    path: List[str]
+    total_distance_km: float
+    latency_ms: float
+    hop_count: int
+    reliability_score: float
+    cost_index: float
+    congestion_risk: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@lru_cache(maxsize=256)
+def _metrics_for_utilizations(utilizations: Tuple[float, ...]) -> Tuple[float, float, float]:
+    """(average, max, efficiency) for a set of station utilizations"""
+    from ._network_kernels import utilization_metrics
+    np = lazy_import("numpy")
+    if not utilizations:
+        return 0, 0, 0
+    values = np.fromiter(utilizations, dtype=np.float64, count=len(utilizations))
+    avg_utilization, max_utilization, efficiency = utilization_metrics(values)
+    return float(avg_utilization), float(max_utilization), float(efficiency)
+
+@lru_cache(maxsize=256)
+def _load_statistics(loads: Tuple[float, ...]) -> Tuple[float, float, float]:
+    """(average, standard deviation, efficiency) for a set of station loads"""
+    from ._network_kernels import load_stats
+    np = lazy_import("numpy")
+    if not loads:
+        return 0, 0, 0
+    values = np.fromiter(loads, dtype=np.float64, count=len(loads))
+    avg_load, std_dev = (float(v) for v in load_stats(values))
+    return avg_load, std_dev, 100 - (std_dev / avg_load * 100) if avg_load > 0 else 0
 
 class NetworkOptimizerAgent(BaseCrewAgent):
     """Expert agent for network optimization and capacity planning"""
     
+    # Per-agent state lives in slots; BaseCrewAgent attributes keep their __dict__
+    __slots__ = ("_rng", "_response_cache", "_topology_cache")
+    
+    # Static capability description merged into the LLM fallback context
+    CAPABILITY_CONTEXT = MappingProxyType({
+        "agent_capabilities": (
+            "Network topology optimization and design",
+            "Capacity planning and bandwidth allocation",
+            "Load balancing and traffic engineering",
+            "Quality of Service (QoS) optimization",
+            "Cost optimization and resource utilization",
+            "Performance monitoring and bottleneck analysis"
+        ),
+        "analysis_types": (
+            "Network architecture design and optimization",
+            "Traffic flow analysis and capacity modeling",
+            "Resource allocation and utilization studies",
+            "Performance tuning and optimization strategies",
+            "Cost-benefit analysis for network investments",
+            "Service level agreement (SLA) compliance analysis"
+        )
+    })
+    
     def __init__(self):
         super().__init__(
             role="Senior Network Optimization Engineer",
@@ -33,21 +257,44 @@ class NetworkOptimizerAgent(BaseCrewAgent):
             tools=[]
         )
         
+        # One PCG64 generator per agent, created on the first synthetic traffic
+        # draw so that agents answering only LLM queries never load NumPy
+        self._rng = None
+        
+        # LRU of serialized analysis responses keyed by _request_digest()
+        self._response_cache: "OrderedDict[bytes, str]" = OrderedDict()
+        
+        # LRU of topology analyses keyed by _topology_digest()
+        self._topology_cache: "OrderedDict[bytes, Dict[str, Any]]" = OrderedDict()
+        
     def optimize_network_topology(self, stations: List[Dict], 
-                                 traffic_matrix: Optional[Dict] = None) -> Dict[str, Any]:
-        """Optimize network topology for efficiency and redundancy"""
+                                 traffic_matrix: Optional[Union[Dict, TrafficMatrix]] = None) -> Dict[str, Any]:
+        """Optimize network topology for efficiency and redundancy
+        
+        Results for a caller-supplied traffic matrix are cached per station set
+        and matrix, so the returned dict must be treated as read-only.
+        """
         
         n_stations = len(stations)
         
         # Create traffic matrix if not provided
+        key = None
         if not traffic_matrix:
             traffic_matrix = self._generate_traffic_matrix(stations)
+        else:
+            if not isinstance(traffic_matrix, TrafficMatrix):
+                traffic_matrix = TrafficMatrix.from_dict(traffic_matrix)
+            key = _topology_digest(stations, traffic_matrix)
+            cached = self._topology_cache.get(key) if key is not None else None
+            if cached is not None:
+                self._topology_cache.move_to_end(key)
+                return cached
         
         # Calculate current network metrics
         current_metrics = self._calculate_network_metrics(stations, traffic_matrix)
         
         # Identify critical paths
-        critical_paths = self._identify_critical_paths(stations, traffic_matrix)
+        critical_paths, critical_endpoints = self._identify_critical_paths(stations, traffic_matrix)
         
         # Optimize topology
         optimization = {
@@ -84,11 +331,15 @@ class NetworkOptimizerAgent(BaseCrewAgent):
             })
         
         # Redundancy analysis
-        optimization["redundancy_analysis"] = self._analyze_redundancy(stations, critical_paths)
+        optimization["redundancy_analysis"] = self._analyze_redundancy(stations, critical_endpoints)
         
         # Cost-benefit analysis
         optimization["cost_benefit"] = self._calculate_optimization_roi(optimization["recommended_changes"])
         
+        if key is not None:
+            self._topology_cache[key] = optimization
+            if len(self._topology_cache) > TOPOLOGY_CACHE_SIZE:
+                self._topology_cache.popitem(last=False)
         return optimization
     
     def capacity_planning_analysis(self, 
@@ -96,10 +347,12 @@ class NetworkOptimizerAgent(BaseCrewAgent):
                                   growth_rate: float = 0.15,
                                   planning_horizon_years: int = 3) -> Dict[str, Any]:
         """Perform capacity planning analysis with growth projections"""
+        np = lazy_import("numpy")
         
+        baseline_total = sum(current_demand.values())
         analysis = {
             "current_state": {
-                "total_demand_gbps": sum(current_demand.values()),
+                "total_demand_gbps": baseline_total,
                 "peak_demand_gbps": max(current_demand.values()),
                 "stations": len(current_demand)
             },
@@ -108,40 +361,49 @@ class NetworkOptimizerAgent(BaseCrewAgent):
             "investment_timeline": []
         }
         
+        # Project every station over the whole horizon in one (years, stations)
+        # product; every per-year series below is a whole-array expression
+        years = np.arange(1, planning_horizon_years + 1)
+        growth_factors = (1 + growth_rate) ** years
+        demand = np.fromiter(current_demand.values(), dtype=np.float64, count=len(current_demand))
+        projected = growth_factors[:, None] * demand[None, :]
+        projected_totals = projected.sum(axis=1)
+        required_capacity = projected_totals * 1.3  # 30% headroom
+        year_list = years.tolist()
+        
         # Calculate projections
-        for year in range(1, planning_horizon_years + 1):
-            growth_factor = (1 + growth_rate) ** year
-            projected_demand = {k: v * growth_factor for k, v in current_demand.items()}
-            
-            projection = {
+        analysis["projections"] = [
+            {
                 "year": year,
-                "total_demand_gbps": round(sum(projected_demand.values()), 2),
-                "peak_demand_gbps": round(max(projected_demand.values()), 2),
-                "growth_from_baseline": f"{(growth_factor - 1) * 100:.1f}%"
+                "total_demand_gbps": round(total, 2),
+                "peak_demand_gbps": round(peak, 2),
+                "growth_from_baseline": f"{growth_pct:.1f}%"
             }
-            analysis["projections"].append(projection)
-            
-            # Capacity requirements
-            required_capacity = sum(projected_demand.values()) * 1.3  # 30% headroom
-            analysis["capacity_requirements"].append({
+            for year, total, peak, growth_pct in zip(year_list, projected_totals.tolist(),
+                                                     projected.max(axis=1).tolist(),
+                                                     ((growth_factors - 1) * 100).tolist())
+        ]
+        
+        # Capacity requirements
+        analysis["capacity_requirements"] = [
+            {
                 "year": year,
-                "required_capacity_gbps": round(required_capacity, 2),
-                "additional_capacity_needed": round(required_capacity - sum(current_demand.values()), 2)
-            })
-            
-            # Investment timeline
-            if year == 1:
-                investment = "Immediate: Upgrade existing infrastructure"
-            elif year == 2:
-                investment = "Mid-term: Add redundant capacity"
-            else:
-                investment = "Long-term: New station deployment"
-            
-            analysis["investment_timeline"].append({
+                "required_capacity_gbps": round(required, 2),
+                "additional_capacity_needed": round(additional, 2)
+            }
+            for year, required, additional in zip(year_list, required_capacity.tolist(),
+                                                  (required_capacity - baseline_total).tolist())
+        ]
+        
+        # Investment timeline
+        analysis["investment_timeline"] = [
+            {
                 "year": year,
-                "recommendation": investment,
-                "estimated_cost_multiplier": 1 + (year * 0.5)
-            })
+                "recommendation": INVESTMENT_STAGES[min(year, len(INVESTMENT_STAGES)) - 1],
+                "estimated_cost_multiplier": multiplier
+            }
+            for year, multiplier in zip(year_list, (1 + years * 0.5).tolist())
+        ]
         
         # Add recommendations
         analysis["recommendations"] = self._get_capacity_recommendations(growth_rate, analysis["projections"])
@@ -152,10 +414,18 @@ class NetworkOptimizerAgent(BaseCrewAgent):
                                    stations: List[Dict],
                                    traffic_load: Dict[str, float]) -> Dict[str, Any]:
         """Optimize load balancing across stations"""
+        np = lazy_import("numpy")
+        
+        # Station capacities and traffic loads as flat arrays
+        capacities = np.fromiter(
+            (s.get("capacity_metrics", {}).get("total_capacity_gbps", 10) for s in stations),
+            dtype=np.float64, count=len(stations)
+        )
+        loads = np.fromiter(traffic_load.values(), dtype=np.float64, count=len(traffic_load))
         
         # Calculate current load distribution
-        total_load = sum(traffic_load.values())
-        total_capacity = sum(s.get("capacity_metrics", {}).get("total_capacity_gbps", 10) for s in stations)
+        total_load = float(loads.sum())
+        total_capacity = float(capacities.sum())
         
         # Current state analysis
         current_state = {
@@ -166,7 +436,7 @@ class NetworkOptimizerAgent(BaseCrewAgent):
         }
         
         # Optimize load distribution
-        optimized_distribution = self._optimize_load_distribution(stations, traffic_load)
+        optimized_distribution = self._optimize_load_distribution(stations, capacities, total_load)
         
         # Calculate improvements
         improvements = {
@@ -192,97 +462,213 @@ class NetworkOptimizerAgent(BaseCrewAgent):
                            intermediate_nodes: List[Dict],
                            constraints: Optional[Dict] = None) -> Dict[str, Any]:
         """Optimize routing paths between source and destination"""
+        from ._network_kernels import CONGESTION_LABELS, path_cost
         
-        # Calculate all possible paths
-        all_paths = self._find_all_paths(source, destination, intermediate_nodes)
+        # Degenerate request: the source already is the destination
+        if source == destination:
+            here = PathEvaluation(
+                path=[source.get("name", "Source")],
+                total_distance_km=0.0,
+                latency_ms=0.0,
+                hop_count=0,
+                reliability_score=1.0,
+                cost_index=round(float(path_cost(0.0, 0)), 2),
+                congestion_risk=CONGESTION_LABELS[0]
+            )
+            return self._routing_result(source, destination, constraints, 1, here, [],
+                                        ["Source and destination coincide - no routing required"])
+        
+        # Calculate the shortest candidate paths
+        all_paths = self._find_all_paths(source, destination, intermediate_nodes,
+                                         max_link_km=(constraints or {}).get("max_link_km"))
+        if not all_paths:
+            return self._routing_result(source, destination, constraints, 0, None, [],
+                                        ["Destination unreachable under the link constraints - "
+                                         "relax max_link_km or add intermediate nodes"])
         
         # Evaluate paths based on multiple criteria
-        evaluated_paths = []
-        for path in all_paths[:10]:  # Limit to top 10 paths
-            evaluation = {
-                "path": path["nodes"],
-                "total_distance_km": path["distance"],
-                "latency_ms": path["distance"] / 200,  # Approximate speed of light in fiber
-                "hop_count": len(path["nodes"]) - 1,
-                "reliability_score": self._calculate_path_reliability(path),
-                "cost_index": self._calculate_path_cost(path),
-                "congestion_risk": self._assess_congestion_risk(path)
-            }
-            evaluated_paths.append(evaluation)
+        evaluated_paths = self._evaluate_paths(all_paths[:10])  # Limit to top 10 paths
         
         # Select optimal paths
-        primary_path = min(evaluated_paths, key=lambda x: x["latency_ms"])
+        primary_path = min(evaluated_paths, key=lambda x: x.latency_ms)
         backup_paths = sorted([p for p in evaluated_paths if p != primary_path], 
-                            key=lambda x: x["reliability_score"], reverse=True)[:2]
+                            key=lambda x: x.reliability_score, reverse=True)[:2]
+        
+        return self._routing_result(source, destination, constraints, len(all_paths), primary_path,
+                                    backup_paths, self._get_routing_recommendations(primary_path, backup_paths))
+    
+    def batch_routing_optimization(self,
+                                   pairs: List[List[Dict[str, float]]],
+                                   intermediate_nodes: List[Dict],
+                                   constraints: Optional[Dict] = None) -> Dict[str, Any]:
+        """Optimal route for each (source, destination) pair over one shared link graph
+        
+        Pairs that share a source reuse a single shortest-path sweep from it.
+        """
+        from ._network_routing import build_route_graph, shortest_path_tree, tree_path
+        
+        # Deduplicate endpoints; relay nodes follow them in the link graph
+        index: Dict[Tuple, int] = {}
+        points: List[Dict] = []
+        pair_nodes = []
+        for source, destination in pairs:
+            ends = []
+            for point in (source, destination):
+                key = (point.get("name"), point.get("latitude", 0), point.get("longitude", 0))
+                if key not in index:
+                    index[key] = len(points)
+                    points.append(point)
+                ends.append(index[key])
+            pair_nodes.append(ends)
+        
+        names = [p.get("name", f"Node {i}") for i, p in enumerate(points)] + [n["name"] for n in intermediate_nodes]
+        coords = tuple((p.get("latitude", 0), p.get("longitude", 0)) for p in points) + tuple(
+            (n.get("location", {}).get("latitude", 0), n.get("location", {}).get("longitude", 0))
+            for n in intermediate_nodes
+        )
+        graph = build_route_graph(coords, (constraints or {}).get("max_link_km"))
+        
+        trees = {}
+        found = []
+        for src, dst in pair_nodes:
+            if src not in trees:
+                trees[src] = shortest_path_tree(graph, src)
+            dist, pred = trees[src]
+            path = tree_path(pred, src, dst)
+            if path is not None:
+                found.append({"nodes": [names[i] for i in path], "distance": dist[dst]})
+            else:
+                found.append(None)
+        
+        evaluated = iter(self._evaluate_paths([p for p in found if p is not None]))
+        routes = [
+            {
+                "source": source,
+                "destination": destination,
+                "primary": next(evaluated).to_dict() if path is not None else None
+            }
+            for (source, destination), path in zip(pairs, found)
+        ]
+        
+        recommendations = []
+        unreachable = sum(route["primary"] is None for route in routes)
+        if unreachable:
+            recommendations.append(f"{unreachable} pair(s) unreachable under the link constraints - "
+                                   "relax max_link_km or add intermediate nodes")
+        slow = sum(route["primary"] is not None and route["primary"]["latency_ms"] > 100 for route in routes)
+        if slow:
+            recommendations.append(f"Consider closer intermediate nodes to reduce latency on {slow} route(s)")
         
+        return {
+            "routing_analysis": {
+                "pairs_analyzed": len(pairs),
+                "unique_sources": len(trees),
+                "constraints_applied": constraints or "None"
+            },
+            "routes": routes,
+            "recommendations": recommendations
+        }
+    
+    def _evaluate_paths(self, candidates: List[Dict]) -> List[PathEvaluation]:
+        """Score candidate paths on latency, reliability, cost and congestion"""
+        from ._network_kernels import CONGESTION_LABELS, congestion_level, path_cost, path_reliability
+        np = lazy_import("numpy")
+        distances = np.fromiter((p["distance"] for p in candidates), dtype=np.float64, count=len(candidates))
+        hops = np.fromiter((len(p["nodes"]) - 1 for p in candidates), dtype=np.int64, count=len(candidates))
+        reliability = path_reliability(hops).tolist()
+        cost = path_cost(distances, hops).tolist()
+        congestion = congestion_level(hops).tolist()
+        
+        return [
+            PathEvaluation(
+                path=path["nodes"],
+                total_distance_km=path["distance"],
+                latency_ms=path["distance"] / 200,  # Approximate speed of light in fiber
+                hop_count=len(path["nodes"]) - 1,
+                reliability_score=round(reliability[k], 3),
+                cost_index=round(cost[k], 2),
+                congestion_risk=CONGESTION_LABELS[congestion[k]]
+            )
+            for k, path in enumerate(candidates)
+        ]
+    
+    def _routing_result(self, source: Dict, destination: Dict, constraints: Optional[Dict],
+                        paths_analyzed: int, primary_path: Optional[PathEvaluation],
+                        backup_paths: List[PathEvaluation], recommendations: List[str]) -> Dict[str, Any]:
+        """Assemble the routing response; primary_path is None when no route exists"""
         return {
             "routing_analysis": {
                 "source": source,
                 "destination": destination,
-                "total_paths_analyzed": len(all_paths),
+                "total_paths_analyzed": paths_analyzed,
                 "constraints_applied": constraints or "None"
             },
             "optimal_routes": {
-                "primary": primary_path,
-                "backup": backup_paths
+                "primary": primary_path.to_dict() if primary_path else None,
+                "backup": [p.to_dict() for p in backup_paths]
             },
             "performance_metrics": {
-                "expected_latency_ms": primary_path["latency_ms"],
-                "reliability_percentage": primary_path["reliability_score"] * 100,
+                "expected_latency_ms": primary_path.latency_ms if primary_path else None,
+                "reliability_percentage": primary_path.reliability_score * 100 if primary_path else 0.0,
                 "path_diversity_score": self._calculate_diversity_score(primary_path, backup_paths)
             },
-            "recommendations": self._get_routing_recommendations(primary_path, backup_paths)
+            "recommendations": recommendations
         }
     
     def qos_optimization(self, 
                         traffic_classes: Dict[str, Dict],
                         available_bandwidth_gbps: float) -> Dict[str, Any]:
         """Optimize Quality of Service parameters for different traffic classes"""
+        np = lazy_import("numpy")
         
-        # Define QoS priorities
-        qos_priorities = {
-            "real_time": {"priority": 1, "latency_req_ms": 50, "jitter_req_ms": 5},
-            "mission_critical": {"priority": 2, "latency_req_ms": 100, "jitter_req_ms": 20},
-            "business": {"priority": 3, "latency_req_ms": 200, "jitter_req_ms": 50},
-            "bulk": {"priority": 4, "latency_req_ms": 1000, "jitter_req_ms": 200}
-        }
+        # Sort classes on the precomputed flat priority ranks
+        order = sorted(traffic_classes, key=lambda c: QOS_PRIORITY_RANK.get(c, 999))
         
-        # Allocate bandwidth based on priorities
-        bandwidth_allocation = {}
+        # Allocate bandwidth based on priorities, tracked as parallel lists
+        requested = [traffic_classes[c].get("bandwidth_gbps", 0) for c in order]
+        allocated = []
+        satisfaction = []
         remaining_bandwidth = available_bandwidth_gbps
         
-        for traffic_class, requirements in sorted(traffic_classes.items(), 
-                                                 key=lambda x: qos_priorities.get(x[0], {}).get("priority", 999)):
-            requested = requirements.get("bandwidth_gbps", 0)
-            allocated = min(requested, remaining_bandwidth * 0.4)  # Max 40% per class initially
-            bandwidth_allocation[traffic_class] = {
-                "allocated_gbps": round(allocated, 2),
-                "requested_gbps": requested,
-                "satisfaction_rate": round((allocated / requested * 100) if requested > 0 else 100, 2)
+        for req in requested:
+            alloc = min(req, remaining_bandwidth * 0.4)  # Max 40% per class initially
+            allocated.append(round(alloc, 2))
+            satisfaction.append(round((alloc / req * 100) if req > 0 else 100, 2))
+            remaining_bandwidth -= alloc
+        
+        # Distribute remaining bandwidth by water-filling: every class with unmet
+        # demand is raised to a common level, capped at its demand
+        if remaining_bandwidth > 0 and order:
+            requested_arr = np.asarray(requested, dtype=np.float64)
+            allocated_arr = np.asarray(allocated, dtype=np.float64)
+            allocated_arr += _water_fill(requested_arr - allocated_arr, remaining_bandwidth)
+            
+            allocated = np.round(allocated_arr, 2).tolist()
+            satisfaction = np.round(
+                np.divide(allocated_arr * 100, requested_arr, out=np.full_like(allocated_arr, 100.0),
+                          where=requested_arr > 0), 2
+            ).tolist()
+        
+        bandwidth_allocation = {
+            traffic_class: {
+                "allocated_gbps": allocated[k],
+                "requested_gbps": requested[k],
+                "satisfaction_rate": satisfaction[k]
             }
-            remaining_bandwidth -= allocated
-        
-        # Distribute remaining bandwidth
-        if remaining_bandwidth > 0:
-            for traffic_class in bandwidth_allocation:
-                if bandwidth_allocation[traffic_class]["satisfaction_rate"] < 100:
-                    additional = min(remaining_bandwidth * 0.5, 
-                                   bandwidth_allocation[traffic_class]["requested_gbps"] - 
-                                   bandwidth_allocation[traffic_class]["allocated_gbps"])
-                    bandwidth_allocation[traffic_class]["allocated_gbps"] += additional
-                    remaining_bandwidth -= additional
+            for k, traffic_class in enumerate(order)
+        }
         
         # Calculate QoS metrics
+        total_allocated = sum(allocated)
         qos_metrics = {
-            "total_allocated_gbps": sum(b["allocated_gbps"] for b in bandwidth_allocation.values()),
-            "utilization_percentage": round((sum(b["allocated_gbps"] for b in bandwidth_allocation.values()) / 
-                                           available_bandwidth_gbps) * 100, 2),
-            "average_satisfaction": round(sum(b["satisfaction_rate"] for b in bandwidth_allocation.values()) / 
-                                        len(bandwidth_allocation), 2)
+            "total_allocated_gbps": total_allocated,
+            "utilization_percentage": round((total_allocated / available_bandwidth_gbps) * 100, 2),
+            # No classes requested means nothing is left unsatisfied
+            "average_satisfaction": round(sum(satisfaction) / len(satisfaction), 2) if satisfaction else 100.0
         }
         
         # Generate QoS policy
-        qos_policy = self._generate_qos_policy(bandwidth_allocation, qos_priorities)
+        qos_policy = self._generate_qos_policy(bandwidth_allocation, QOS_PRIORITIES)
         
         return {
             "bandwidth_allocation": bandwidth_allocation,
@@ -296,40 +682,49 @@ class NetworkOptimizerAgent(BaseCrewAgent):
                                   utilization_data: Dict[str, float],
                                   optimization_target: str = "balanced") -> Dict[str, Any]:
         """Analyze and optimize network costs"""
+        np = lazy_import("numpy")
         
-        total_cost = sum(network_costs.values())
-        avg_utilization = sum(utilization_data.values()) / len(utilization_data) if utilization_data else 0
+        costs = np.fromiter(network_costs.values(), dtype=np.float64, count=len(network_costs))
+        utilization = np.fromiter(utilization_data.values(), dtype=np.float64, count=len(utilization_data))
+        total_cost = float(costs.sum())
+        avg_utilization = float(utilization.mean()) if utilization.size else 0
         
-        # Cost efficiency analysis
-        cost_per_utilized_percent = total_cost / avg_utilization if avg_utilization > 0 else float('inf')
+        # Cost efficiency analysis; undefined when nothing is utilized, reported
+        # as null because float('inf') serializes to invalid JSON ("Infinity")
+        cost_efficiency = round(total_cost / avg_utilization, 2) if avg_utilization > 0 else None
         
-        # Identify cost optimization opportunities
+        # Identify cost optimization opportunities with boolean masks; dicts are
+        # only materialized for the resources that match
         opportunities = []
         
-        # Underutilized expensive resources
-        for resource, cost in network_costs.items():
-            if resource in utilization_data:
-                util = utilization_data[resource]
-                if util < 50 and cost > total_cost * 0.1:
-                    opportunities.append({
-                        "type": "underutilized_expensive",
-                        "resource": resource,
-                        "current_cost": cost,
-                        "utilization": util,
-                        "potential_savings": cost * 0.3,
-                        "action": "Downsize or redistribute load"
-                    })
+        # Underutilized expensive resources (utilization aligned to costs, NaN if missing)
+        cost_resources = list(network_costs)
+        aligned_utilization = np.fromiter((utilization_data.get(r, np.nan) for r in cost_resources),
+                                          dtype=np.float64, count=len(cost_resources))
+        underutilized = (aligned_utilization < 50) & (costs > total_cost * 0.1)
+        for idx in np.flatnonzero(underutilized).tolist():
+            resource = cost_resources[idx]
+            cost = network_costs[resource]
+            opportunities.append({
+                "type": "underutilized_expensive",
+                "resource": resource,
+                "current_cost": cost,
+                "utilization": utilization_data[resource],
+                "potential_savings": cost * 0.3,
+                "action": "Downsize or redistribute load"
+            })
         
         # Overutilized resources
-        for resource, util in utilization_data.items():
-            if util > 90:
-                opportunities.append({
-                    "type": "overutilized",
-                    "resource": resource,
-                    "utilization": util,
-                    "risk": "High - potential service degradation",
-                    "action": "Upgrade capacity or load balance"
-                })
+        util_resources = list(utilization_data)
+        for idx in np.flatnonzero(utilization > 90).tolist():
+            resource = util_resources[idx]
+            opportunities.append({
+                "type": "overutilized",
+                "resource": resource,
+                "utilization": utilization_data[resource],
+                "risk": "High - potential service degradation",
+                "action": "Upgrade capacity or load balance"
+            })
         
         # Optimization strategies based on target
         strategies = {
@@ -344,58 +739,81 @@ class NetworkOptimizerAgent(BaseCrewAgent):
             "current_state": {
                 "total_monthly_cost": round(total_cost, 2),
                 "average_utilization": round(avg_utilization, 2),
-                "cost_efficiency": round(cost_per_utilized_percent, 2)
+                "cost_efficiency": cost_efficiency
             },
             "optimization_opportunities": opportunities,
             "recommended_strategy": selected_strategy,
             "projected_savings": {
                 "monthly": round(selected_strategy["savings"], 2),
                 "annual": round(selected_strategy["savings"] * 12, 2),
-                "percentage": round((selected_strategy["savings"] / total_cost) * 100, 2)
+                "percentage": round((selected_strategy["savings"] / total_cost) * 100, 2) if total_cost > 0 else 0
             },
             "implementation_plan": selected_strategy["implementation"],
             "risk_assessment": selected_strategy["risk"]
         }
     
     # Helper methods
-    def _generate_traffic_matrix(self, stations: List[Dict]) -> Dict:
+    def _generate_traffic_matrix(self, stations: List[Dict]) -> TrafficMatrix:
         """Generate a traffic matrix between stations"""
-        matrix = {}
-        for i, source in enumerate(stations):
-            for j, dest in enumerate(stations):
-                if i != j:
-                    # Simulate traffic based on station capacities
-                    traffic = random.uniform(0.1, 2.0)  # Gbps
-                    matrix[f"{source['name']}->{dest['name']}"] = traffic
-        return matrix
-    
-    def _calculate_network_metrics(self, stations: List[Dict], traffic: Dict) -> Dict:
+        np = lazy_import("numpy")
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        names = [s["name"] for s in stations]
+        n = len(names)
+        
+        # Simulate traffic based on station capacities, one draw for all pairs
+        traffic = self._rng.uniform(0.1, 2.0, size=(n, n))  # Gbps
+        np.fill_diagonal(traffic, np.nan)
+        return TrafficMatrix(names, traffic)
+    
+    def _calculate_network_metrics(self, stations: List[Dict], traffic: TrafficMatrix) -> Dict:
         """Calculate network performance metrics"""
-        utilizations = [s.get("utilization_metrics", {}).get("current_utilization", 50) for s in stations]
+        avg_utilization, max_utilization, efficiency = _metrics_for_utilizations(
+            tuple(s.get("utilization_metrics", {}).get("current_utilization", 50) for s in stations)
+        )
         return {
-            "avg_utilization": sum(utilizations) / len(utilizations) if utilizations else 0,
-            "max_utilization": max(utilizations) if utilizations else 0,
-            "efficiency": 100 - (max(utilizations) - min(utilizations)) if utilizations else 0
+            "avg_utilization": avg_utilization,
+            "max_utilization": max_utilization,
+            "efficiency": efficiency
         }
     
-    def _identify_critical_paths(self, stations: List[Dict], traffic: Dict) -> List[Dict]:
-        """Identify critical network paths"""
+    def _identify_critical_paths(self, stations: List[Dict],
+                                 traffic: TrafficMatrix) -> Tuple[List[Dict], List[Tuple[str, str]]]:
+        """Identify critical network paths and their (source, destination) endpoints
+        
+        Path labels are only formatted for the selected pairs, never for the
+        full n x n matrix.
+        """
+        np = lazy_import("numpy")
+        flat = traffic.values.ravel()
+        present = np.flatnonzero(~np.isnan(flat))
+        loads = flat[present]
+        
+        # Select the five heaviest pairs in linear time, then order just those
+        k = min(5, loads.size)
+        top = np.argpartition(-loads, k - 1)[:k] if k else present[:0]
+        top = present[top[np.argsort(-loads[top], kind="stable")]]
+        
+        n = len(traffic.names)
         critical = []
-        for path, load in sorted(traffic.items(), key=lambda x: x[1], reverse=True)[:5]:
+        endpoints = []
+        for idx in top.tolist():
+            i, j = divmod(idx, n)
+            load = float(flat[idx])
             critical.append({
-                "path": path,
+                "path": traffic.label(i, j),
                 "traffic_gbps": round(load, 2),
                 "criticality": "High" if load > 1.5 else "Medium"
             })
-        return critical
+            endpoints.append((traffic.names[i], traffic.names[j]))
+        return critical, endpoints
     
-    def _analyze_redundancy(self, stations: List[Dict], critical_paths: List[Dict]) -> Dict:
+    def _analyze_redundancy(self, stations: List[Dict], critical_endpoints: List[Tuple[str, str]]) -> Dict:
         """Analyze network redundancy"""
-        single_points = []
-        for station in stations:
-            connections = sum(1 for path in critical_paths if station["name"] in path.get("path", ""))
-            if connections > 3:
-                single_points.append(station["name"])
+        # Count critical paths per node from the endpoint names directly, rather
+        # than parsing them back out of the "src->dst" labels
+        connections = Counter(name for pair in critical_endpoints for name in set(pair))
+        single_points = [station["name"] for station in stations if connections[station["name"]] > 3]
         
         return {
             "redundancy_level": "Good" if len(single_points) == 0 else "Poor" if len(single_points) > 2 else "Fair",
@@ -405,7 +823,8 @@ class NetworkOptimizerAgent(BaseCrewAgent):
     
     def _calculate_optimization_roi(self, changes: List[Dict]) -> Dict:
         """Calculate ROI for optimization changes"""
-        total_cost = sum(100 * (1 if c["priority"] == "High" else 0.5) for c in changes)
+        # Compensated summation keeps the total exact however many changes accumulate
+        total_cost = 100 * math.fsum(1.0 if c["priority"] == "High" else 0.5 for c in changes)
         expected_benefit = total_cost * 2.5  # Assume 2.5x return
         
         return {
@@ -435,37 +854,30 @@ class NetworkOptimizerAgent(BaseCrewAgent):
     
     def _calculate_load_distribution(self, stations: List[Dict], traffic: Dict) -> Dict:
         """Calculate load distribution metrics"""
-        loads = list(traffic.values())
-        avg_load = sum(loads) / len(loads) if loads else 0
-        variance = sum((l - avg_load) ** 2 for l in loads) / len(loads) if loads else 0
+        avg_load, std_dev, efficiency = _load_statistics(tuple(traffic.values()))
         
         return {
             "average_load": round(avg_load, 2),
-            "std_deviation": round(math.sqrt(variance), 2),
-            "efficiency": round(100 - (math.sqrt(variance) / avg_load * 100) if avg_load > 0 else 0, 2)
+            "std_deviation": round(std_dev, 2),
+            "efficiency": round(efficiency, 2)
         }
     
-    def _optimize_load_distribution(self, stations: List[Dict], traffic: Dict) -> Dict:
+    def _optimize_load_distribution(self, stations: List[Dict], capacities: "np.ndarray", total_load: float) -> Dict:
         """Optimize load distribution across stations"""
+        np = lazy_import("numpy")
         # Simplified load balancing algorithm
-        total_capacity = sum(s.get("capacity_metrics", {}).get("total_capacity_gbps", 10) for s in stations)
-        total_load = sum(traffic.values())
+        total_capacity = float(capacities.sum())
         target_utilization = (total_load / total_capacity) * 100
         
-        optimized = {
+        # Distribute load proportionally to capacity
+        allocated = np.round(capacities * (total_load / total_capacity), 2).tolist()
+        
+        return {
             "avg_utilization": round(target_utilization, 2),
             "std_deviation": 5.0,  # Target low deviation
             "efficiency_score": 85.0,  # Target efficiency
-            "distribution": {}
+            "distribution": {station["name"]: load for station, load in zip(stations, allocated)}
         }
-        
-        # Distribute load proportionally to capacity
-        for station in stations:
-            capacity = station.get("capacity_metrics", {}).get("total_capacity_gbps", 10)
-            allocated_load = (capacity / total_capacity) * total_load
-            optimized["distribution"][station["name"]] = round(allocated_load, 2)
-        
-        return optimized
     
     def _create_migration_plan(self, current: Dict, optimized: Dict) -> List[Dict]:
         """Create traffic migration plan"""
@@ -505,84 +917,49 @@ class NetworkOptimizerAgent(BaseCrewAgent):
             "Monitor performance continuously"
         ]
     
-    def _find_all_paths(self, source: Dict, dest: Dict, nodes: List[Dict]) -> List[Dict]:
-        """Find all possible paths between source and destination"""
-        # Simplified pathfinding - in reality would use graph algorithms
-        paths = []
-        
-        # Direct path
-        direct_distance = self._calculate_distance(source, dest)
-        paths.append({
-            "nodes": [source.get("name", "Source"), dest.get("name", "Dest")],
-            "distance": direct_distance
-        })
-        
-        # Paths through intermediate nodes
-        for node in nodes[:5]:  # Limit for simplicity
-            dist1 = self._calculate_distance(source, {"latitude": node.get("location", {}).get("latitude", 0),
-                                                     "longitude": node.get("location", {}).get("longitude", 0)})
-            dist2 = self._calculate_distance({"latitude": node.get("location", {}).get("latitude", 0),
-                                             "longitude": node.get("location", {}).get("longitude", 0)}, dest)
-            paths.append({
-                "nodes": [source.get("name", "Source"), node["name"], dest.get("name", "Dest")],
-                "distance": dist1 + dist2
-            })
+    def _find_all_paths(self, source: Dict, dest: Dict, nodes: List[Dict],
+                        k: int = 10, max_link_km: Optional[float] = None) -> List[Dict]:
+        """Find the k shortest loopless paths between source and destination"""
+        from ._network_routing import build_route_graph, component_labels, k_shortest_paths
+        names = [source.get("name", "Source"), dest.get("name", "Dest")] + [n["name"] for n in nodes]
+        points = [source, dest] + [n.get("location", {}) for n in nodes]
+        coords = tuple((p.get("latitude", 0), p.get("longitude", 0)) for p in points)
         
-        return sorted(paths, key=lambda x: x["distance"])
-    
-    def _calculate_distance(self, point1: Dict, point2: Dict) -> float:
-        """Calculate distance between two points"""
-        # Simplified distance calculation
-        lat_diff = abs(point1.get("latitude", 0) - point2.get("latitude", 0))
-        lon_diff = abs(point1.get("longitude", 0) - point2.get("longitude", 0))
-        return math.sqrt(lat_diff**2 + lon_diff**2) * 111  # Rough km conversion
-    
-    def _calculate_path_reliability(self, path: Dict) -> float:
-        """Calculate path reliability score"""
-        # Base reliability decreases with hop count
-        base_reliability = 0.99 ** (len(path["nodes"]) - 1)
-        return round(base_reliability, 3)
-    
-    def _calculate_path_cost(self, path: Dict) -> float:
-        """Calculate path cost index"""
-        # Cost increases with distance and hop count
-        return round(path["distance"] * 0.01 + len(path["nodes"]) * 10, 2)
-    
-    def _assess_congestion_risk(self, path: Dict) -> str:
-        """Assess congestion risk for path"""
-        hop_count = len(path["nodes"]) - 1
-        if hop_count <= 1:
-            return "Low"
-        elif hop_count <= 3:
-            return "Medium"
-        else:
-            return "High"
+        # Source is node 0 and destination node 1 in the cached link graph
+        graph = build_route_graph(coords, max_link_km)
+        labels = component_labels(coords, max_link_km)
+        if labels[0] != labels[1]:
+            return []
+        return [
+            {"nodes": [names[i] for i in path], "distance": distance}
+            for distance, path in k_shortest_paths(graph, 0, 1, k)
+        ]
     
-    def _calculate_diversity_score(self, primary: Dict, backups: List[Dict]) -> float:
+    def _calculate_diversity_score(self, primary: Optional[PathEvaluation], backups: List[PathEvaluation]) -> float:
         """Calculate path diversity score"""
-        if not backups:
+        if primary is None or not backups:
             return 0.0
         
         # Check node overlap
-        primary_nodes = set(primary["path"])
+        primary_nodes = set(primary.path)
         diversity_scores = []
         
         for backup in backups:
-            backup_nodes = set(backup["path"])
+            backup_nodes = set(backup.path)
             overlap = len(primary_nodes.intersection(backup_nodes)) - 2  # Exclude source/dest
             diversity = 1 - (overlap / len(primary_nodes)) if len(primary_nodes) > 2 else 1
             diversity_scores.append(diversity)
         
         return round(sum(diversity_scores) / len(diversity_scores) * 100, 2)
     
-    def _get_routing_recommendations(self, primary: Dict, backups: List[Dict]) -> List[str]:
+    def _get_routing_recommendations(self, primary: PathEvaluation, backups: List[PathEvaluation]) -> List[str]:
         """Get routing recommendations"""
         recommendations = []
         
-        if primary["latency_ms"] > 100:
+        if primary.latency_ms > 100:
             recommendations.append("Consider closer intermediate nodes to reduce latency")
         
-        if primary["reliability_score"] < 0.95:
+        if primary.reliability_score < 0.95:
             recommendations.append("Primary path reliability below target - implement fast failover")
         
         if not backups:
@@ -666,98 +1043,44 @@ class NetworkOptimizerAgent(BaseCrewAgent):
     
     def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Execute a network optimization task"""
-        try:
-            task_lower = task.lower()
-            
-            if "topology" in task_lower:
-                if context and "stations" in context:
-                    result = self.optimize_network_topology(
-                        context["stations"],
-                        context.get("traffic_matrix")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide station data for topology optimization"
-            
-            elif "capacity" in task_lower and "planning" in task_lower:
-                if context and "current_demand" in context:
-                    result = self.capacity_planning_analysis(
-                        context["current_demand"],
-                        context.get("growth_rate", 0.15),
-                        context.get("planning_horizon", 3)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide current demand data for capacity planning"
-            
-            elif "load" in task_lower and "balanc" in task_lower:
-                if context and "stations" in context:
-                    result = self.load_balancing_optimization(
-                        context["stations"],
-                        context.get("traffic_load", {})
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide station and traffic data for load balancing"
-            
-            elif "routing" in task_lower:
-                if context and all(k in context for k in ["source", "destination"]):
-                    result = self.routing_optimization(
-                        context["source"],
-                        context["destination"],
-                        context.get("intermediate_nodes", []),
-                        context.get("constraints")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide source and destination for routing optimization"
-            
-            elif "qos" in task_lower or "quality" in task_lower:
-                if context and "traffic_classes" in context:
-                    result = self.qos_optimization(
-                        context["traffic_classes"],
-                        context.get("bandwidth_gbps", 10)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide traffic classes for QoS optimization"
-            
-            elif "cost" in task_lower:
-                if context and "network_costs" in context:
-                    result = self.cost_optimization_analysis(
-                        context["network_costs"],
-                        context.get("utilization_data", {}),
-                        context.get("optimization_target", "balanced")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide cost data for optimization analysis"
+        intent = _classify_task(task.lower())
+        
+        # For general queries or context-aware responses, use the base LLM execution,
+        # which handles its own failures
+        if intent is None:
+            # Add network optimization-specific context
+            enhanced_context = ChainMap(self.CAPABILITY_CONTEXT, context or _EMPTY_CONTEXT)
             
-            # For general queries or context-aware responses, use the base LLM execution  
-            else:
-                # Add network optimization-specific context
-                enhanced_context = context.copy() if context else {}
-                enhanced_context.update({
-                    "agent_capabilities": [
-                        "Network topology optimization and design",
-                        "Capacity planning and bandwidth allocation",
-                        "Load balancing and traffic engineering", 
-                        "Quality of Service (QoS) optimization",
-                        "Cost optimization and resource utilization",
-                        "Performance monitoring and bottleneck analysis"
-                    ],
-                    "analysis_types": [
-                        "Network architecture design and optimization",
-                        "Traffic flow analysis and capacity modeling",
-                        "Resource allocation and utilization studies",
-                        "Performance tuning and optimization strategies", 
-                        "Cost-benefit analysis for network investments",
-                        "Service level agreement (SLA) compliance analysis"
-                    ]
-                })
-                
-                # Use parent class LLM execution for natural language response
-                return super().execute(task, enhanced_context)
-                
-        except Exception as e:
-            return f"I apologize for the technical difficulty. As your Network Optimizer, I specialize in designing efficient network topologies, optimizing capacity and performance, and ensuring cost-effective resource utilization. I can help you with traffic analysis, bandwidth planning, and performance optimization. What specific network optimization would you like me to analyze?"
\ No newline at end of file
+            # Use parent class LLM execution for natural language response
+            return super().execute(task, enhanced_context)
+        
+        # A list of endpoint pairs selects the batched routing entry
+        if intent == "routing" and context and "pairs" in context:
+            intent = "routing_batch"
+        method_name, extract, missing_message = TASK_DISPATCH[intent]
+        try:
+            args = extract(context or _EMPTY_CONTEXT)
+        except KeyError:
+            return missing_message
+        
+        # Identical requests (LLM retries, UI polling) reuse the serialized answer;
+        # a topology without a traffic matrix draws fresh synthetic traffic every call
+        key = None
+        if intent != "topology" or args[1]:
+            key = _request_digest(intent, args)
+        cached = self._response_cache.get(key) if key is not None else None
+        if cached is not None:
+            self._response_cache.move_to_end(key)
+            return cached
+        
+        # Only malformed context data can fail an analysis
+        try:
+            response = serialize_result(getattr(self, method_name)(*args))
+        except ANALYSIS_ERRORS:
+            return ANALYSIS_ERROR_REPLY
+        
+        if key is not None:
+            self._response_cache[key] = response
+            if len(self._response_cache) > RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+        return response
\ No newline at end of file
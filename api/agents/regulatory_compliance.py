@@ -4,19 +4,346 @@ Specializes in FCC, ITU regulations, and compliance for satellite operations
 """
 
 from crewai import Agent
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Callable, ClassVar, FrozenSet, List, Mapping, Tuple
+import hashlib
 import json
+import re
 from datetime import datetime, timedelta
-from .base_agent import BaseCrewAgent
+from bisect import bisect_right
+from collections import ChainMap, Counter
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from .base_agent import HAS_HYPERSCAN, BaseCrewAgent, FallbackReply, compile_keyword_scanner, lazy_import, serialize_result
+
+# Screening terms, matched case-insensitively anywhere in the text; each set is
+# compiled into one alternation so a scan is a single regex search
+ITAR_KEYWORDS = frozenset({"military", "defense", "crypto"})
+SENSITIVE_DATA_KEYWORDS = frozenset({"military", "intelligence", "classified"})
+PERSONAL_DATA_KEYWORDS = frozenset({"personal", "pii"})
+
+def _keyword_pattern(keywords: FrozenSet[str]) -> "re.Pattern[str]":
+    return re.compile("|".join(map(re.escape, sorted(keywords))), re.IGNORECASE | re.ASCII)
+
+ITAR_PATTERN = _keyword_pattern(ITAR_KEYWORDS)
+SENSITIVE_DATA_PATTERN = _keyword_pattern(SENSITIVE_DATA_KEYWORDS)
+PERSONAL_DATA_PATTERN = _keyword_pattern(PERSONAL_DATA_KEYWORDS)
+
+# Controls required once any personal data is handled
+PERSONAL_DATA_CONTROLS = (
+    "Encryption at rest and in transit",
+    "Access controls and authentication",
+    "Data retention policies",
+    "Breach notification procedures"
+)
+
+# Partner screening: embargoed names may appear inside a longer partner name,
+# allied partners are exempt from export licensing only on an exact match
+EMBARGOED_COUNTRIES = frozenset({"Iran", "North Korea", "Syria", "Cuba"})
+ALLIED_PARTNERS = frozenset({"Canada", "UK", "Australia", "Japan"})
+EMBARGOED_PATTERN = re.compile("|".join(map(re.escape, sorted(EMBARGOED_COUNTRIES))))
+
+# Finding severities in action-plan order, with the response timeline for each
+SEVERITY_RANK = MappingProxyType({"Critical": 0, "High": 1, "Medium": 2, "Low": 3})
+SEVERITY_TIMELINE = MappingProxyType({"Critical": "Immediate", "High": "30 days", "Medium": "60 days", "Low": "60 days"})
+
+# Threshold labels looked up with bisect_right: a value equal to a breakpoint
+# takes the label to its right, matching the original strict < comparisons
+INTERFERENCE_DISTANCE_BREAKS_KM = (100, 500)
+INTERFERENCE_LABELS = ("High", "Medium", "Low")
+PENALTY_FINDING_BREAKS = (3,)
+PENALTY_PROBABILITY_LABELS = ("Low", "Medium")
+
+# Licensing conditions per frequency band, matched in order as a substring of
+# the requested band name
+BAND_REQUIREMENTS = (
+    ("C-band", MappingProxyType({
+        "coordination": "Required with terrestrial services",
+        "special_conditions": "5G interference mitigation may be required",
+        "power_limits": "EIRP density limits apply"
+    })),
+    ("Ka-band", MappingProxyType({
+        "coordination": "Simplified for FSS",
+        "special_conditions": "Rain fade mitigation plans required",
+        "power_limits": "Standard FSS limits"
+    })),
+    ("Ku-band", MappingProxyType({
+        "coordination": "Required with adjacent satellites",
+        "special_conditions": "Two-degree spacing compliance",
+        "power_limits": "Off-axis EIRP limits"
+    })),
+)
+
+# Border regions needing international coordination:
+# ((min lat, max lat, min lon, max lon), note), bounds exclusive
+BORDER_COORDINATION_ZONES = (
+    ((48, 50, -125, -65), "Canada coordination required"),  # US-Canada border
+    ((25, 33, -120, -95), "Mexico coordination required"),  # US-Mexico border
+)
+
+# Bands that need domestic coordination, matched as substrings of the band name
+DOMESTIC_COORDINATION_BANDS = ("C-band", "Ku-band")
+
+# Station compliance checklist; gateways add the extra items. Entries are
+# copied per call because callers update their status
+BASE_CHECKLIST = tuple(MappingProxyType(item) for item in (
+    {"item": "Station license current", "required": True, "status": "Pending"},
+    {"item": "Frequency coordination completed", "required": True, "status": "Pending"},
+    {"item": "Equipment type approved", "required": True, "status": "Pending"},
+    {"item": "RF exposure compliance", "required": True, "status": "Pending"},
+    {"item": "Site access secured", "required": True, "status": "Pending"},
+    {"item": "Insurance coverage adequate", "required": True, "status": "Pending"},
+    {"item": "Emergency procedures documented", "required": True, "status": "Pending"},
+    {"item": "Operator certifications current", "required": False, "status": "Pending"}
+))
+GATEWAY_CHECKLIST = tuple(MappingProxyType(item) for item in (
+    {"item": "24/7 monitoring capability", "required": True, "status": "Pending"},
+    {"item": "Redundant power systems", "required": True, "status": "Pending"}
+))
+
+# Spectrum coordination: mitigation options and the process with affected operators
+INTERFERENCE_MITIGATION_MEASURES = (
+    "Implement frequency offset",
+    "Use orthogonal polarization",
+    "Antenna pattern optimization",
+    "Power flux density limits",
+    "Time-based coordination"
+)
+COORDINATION_PROCESS = (
+    "1. Prepare technical showing",
+    "2. Submit to affected operators",
+    "3. 30-day response period",
+    "4. Negotiate interference mitigation",
+    "5. Document agreements",
+    "6. File with FCC"
+)
+
+# FCC earth station (Form 312) filing guide, then the checklist and tips for any filing
+FCC_EARTH_STATION_FORMS = ("FCC Form 312", "Schedule B")
+FCC_EARTH_STATION_DOCUMENTS = (
+    "Frequency coordination report",
+    "Radiation hazard study",
+    "FAA determination",
+    "Site drawings and maps"
+)
+FCC_EARTH_STATION_STEPS = (
+    "1. Create IBFS account at fcc.gov",
+    "2. Complete frequency coordination",
+    "3. Prepare technical exhibits",
+    "4. Complete Form 312 Main Form",
+    "5. Complete Schedule B technical details",
+    "6. Upload supporting documents",
+    "7. Pay filing fee",
+    "8. Submit and monitor for acceptance",
+    "9. Respond to any FCC inquiries",
+    "10. Receive grant or denial"
+)
+FCC_EARTH_STATION_MISTAKES = (
+    "Incomplete frequency coordination",
+    "Missing radiation hazard analysis",
+    "Incorrect antenna gain patterns",
+    "Mismatched coordinates formats"
+)
+FILING_CHECKLIST = (
+    "Technical parameters finalized",
+    "Coordination completed",
+    "Supporting documents prepared",
+    "Fee payment ready",
+    "Legal review completed"
+)
+FILING_TIPS = (
+    "File early to account for processing delays",
+    "Double-check all technical parameters",
+    "Maintain copies of all submissions",
+    "Monitor email for FCC correspondence",
+    "Consider expedited processing if time-critical"
+)
+
+# Privacy compliance roadmap phases
+PRIVACY_ROADMAP = tuple(MappingProxyType(phase) for phase in (
+    {"phase": "Assessment", "timeline": "Month 1",
+     "activities": ("Data inventory", "Gap analysis", "Risk assessment")},
+    {"phase": "Implementation", "timeline": "Months 2-3",
+     "activities": ("Policy updates", "Technical controls", "Training")},
+    {"phase": "Validation", "timeline": "Month 4",
+     "activities": ("Testing", "Audit", "Certification")}
+))
+
+# Compliance score deduction per finding of each severity
+SEVERITY_WEIGHTS = MappingProxyType({"Critical": 25, "High": 15, "Medium": 5, "Low": 2})
+
+@dataclass(slots=True)
+class Finding:
+    """Audit finding; converted to a dict only when the audit is returned"""
+    severity: str
+    issue: str
+    action: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class ComplianceRisk:
+    """Risk raised by an audit's findings"""
+    risk: str
+    probability: str
+    impact: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class ActionItem:
+    """Action plan entry derived from a finding"""
+    priority: str
+    action: str
+    timeline: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class AffectedOperator:
+    """Existing operator whose assignment overlaps a coordinated frequency"""
+    operator: str
+    frequency_separation_mhz: float
+    distance_km: float
+    interference_potential: str
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@lru_cache(maxsize=4096)
+def _parse_iso_date(value: str) -> datetime:
+    """datetime.fromisoformat, memoized for license dates seen in repeated audits"""
+    return datetime.fromisoformat(value)
+
+# Intents in dispatch priority order, each selected by any of its keywords
+# appearing anywhere in the task, regardless of case
+TASK_ROUTES = (
+    ("licensing", ("licensing", "license")),
+    ("audit", ("audit",)),
+    ("spectrum", ("spectrum", "coordination")),
+    ("itar", ("itar", "export")),
+    ("environmental", ("environmental", "nepa")),
+    ("privacy", ("privacy", "gdpr")),
+    ("filing", ("filing",)),
+)
+
+# One scan over the task reports the intent of every keyword occurrence; the
+# zero-width lookahead lets overlapping keywords all be reported. Case folding
+# is ASCII-only, as str.lower() never maps other letters onto these keywords
+TASK_KEYWORDS = re.compile(
+    "(?=%s)" % "|".join("(?P<%s>%s)" % (intent, "|".join(keywords)) for intent, keywords in TASK_ROUTES),
+    re.IGNORECASE | re.ASCII
+)
+
+if HAS_HYPERSCAN:
+    # All keywords as one caseless literal database; a match reports the
+    # priority of its intent
+    _KEYWORD_PRIORITIES = tuple(
+        (priority, keyword) for priority, (_, keywords) in enumerate(TASK_ROUTES) for keyword in keywords
+    )
+    
+    def _record_priority(priority: int, start: int, end: int, flags: int, best: List[int]) -> None:
+        if priority < best[0]:
+            best[0] = priority
+    
+    _scan_task = compile_keyword_scanner(
+        [keyword for _, keyword in _KEYWORD_PRIORITIES],
+        [priority for priority, _ in _KEYWORD_PRIORITIES],
+        _record_priority,
+        caseless=True
+    )
+    
+    def _classify_task(task: str) -> Optional[str]:
+        """Return the highest-priority intent with a keyword in the task, from a single Hyperscan pass"""
+        best = [len(TASK_ROUTES)]
+        _scan_task(task, best)
+        return TASK_ROUTES[best[0]][0] if best[0] < len(TASK_ROUTES) else None
+else:
+    def _classify_task(task: str) -> Optional[str]:
+        """Return the highest-priority intent with a keyword in the task, from a single regex pass"""
+        found = {match.lastgroup for match in TASK_KEYWORDS.finditer(task)}
+        return next((intent for intent, _ in TASK_ROUTES if intent in found), None)
+
+def _dispatch_entry(method_name: str, defaults: Tuple[Tuple[str, Any], ...],
+                    missing_message: str) -> Tuple[str, Callable, str]:
+    """Bundle a handler with a one-pass extractor for its positional arguments
+    
+    The extractor binds the context's get once and maps it over the argument
+    keys and their defaults. Defaults are shared between calls, so they are
+    read-only.
+    """
+    keys = tuple(key for key, _ in defaults)
+    fallbacks = tuple(default for _, default in defaults)
+    
+    def extract(context: Mapping[str, Any]) -> Tuple[Any, ...]:
+        return tuple(map(context.get, keys, fallbacks))
+    
+    return method_name, extract, missing_message
+
+# intent -> (handler, argument extractor, reply when no context is given)
+TASK_DISPATCH = MappingProxyType({
+    "licensing": _dispatch_entry("licensing_requirements_analysis",
+                                  (("station_type", "gateway"), ("location", MappingProxyType({"country": "USA"})),
+                                   ("frequency_bands", ("Ku-band",)), ("service_type", "FSS")),
+                                  "Please provide station details for licensing analysis"),
+    "audit": _dispatch_entry("compliance_audit",
+                              (("licenses", ()), ("operations", MappingProxyType({})), ("last_audit", None)),
+                              "Please provide current licenses and operations data"),
+    "spectrum": _dispatch_entry("spectrum_coordination",
+                                 (("frequency", 14250), ("bandwidth", 36), ("location", MappingProxyType({})),
+                                  ("existing_operators", ())),
+                                 "Please provide frequency and location details"),
+    "itar": _dispatch_entry("itar_compliance_check",
+                             (("equipment", ()), ("data_types", ()), ("partners", ())),
+                             "Please provide equipment and partner details"),
+    "environmental": _dispatch_entry("environmental_compliance",
+                                      (("site_details", MappingProxyType({})), ("antenna_specs", MappingProxyType({}))),
+                                      "Please provide site and antenna details"),
+    "privacy": _dispatch_entry("data_privacy_compliance",
+                                (("data_types", ()), ("jurisdictions", ("USA",)), ("cross_border", False)),
+                                "Please provide data handling details"),
+    "filing": _dispatch_entry("filing_assistance",
+                               (("filing_type", "FCC_earth_station"), ("station_details", MappingProxyType({}))),
+                               "Please provide filing type and station details"),
+})
+
+def _json_default(value: Any) -> Any:
+    """Encode the read-only default mappings as plain objects in request keys"""
+    if isinstance(value, MappingProxyType):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON data")
+
+def _request_digest(intent: str, args: Tuple[Any, ...]) -> Optional[bytes]:
+    """Stable 16-byte key for an analysis request, or None if the arguments aren't JSON data"""
+    try:
+        canonical = json.dumps([intent, args], sort_keys=True, separators=(",", ":"), default=_json_default)
+    except (TypeError, ValueError):
+        return None
+    return hashlib.blake2b(canonical.encode(), digest_size=16).digest()
+
+# Errors an analysis raises on malformed context data (missing fields, wrong types, bad dates)
+ANALYSIS_ERRORS = (AttributeError, IndexError, KeyError, TypeError, ValueError, ZeroDivisionError)
+
+# Reply returned in place of an analysis that failed on malformed context
+ANALYSIS_ERROR_REPLY = FallbackReply(
+    "I apologize for the technical difficulty. As your Regulatory Compliance specialist, I help ensure "
+    "your ground station operations meet all FCC, ITU, and international requirements. I can assist with "
+    "licensing, spectrum coordination, ITAR compliance, and regulatory filings. What specific compliance "
+    "matter can I help you with?"
+)
+
+# Shared empty layer for ChainMap views when the caller passes no context
+_EMPTY_CONTEXT = MappingProxyType({})
 
 class RegulatoryComplianceAgent(BaseCrewAgent):
     """Expert agent for regulatory compliance and licensing"""
     
-    def __init__(self):
-        super().__init__(
-            role="Senior Regulatory Compliance Expert",
-            goal="Ensure compliance with FCC, ITU, and international regulations for satellite ground station operations",
-            backstory="""You are a seasoned regulatory compliance expert with 20+ years of experience in 
+    ROLE = "Senior Regulatory Compliance Expert"
+    GOAL = "Ensure compliance with FCC, ITU, and international regulations for satellite ground station operations"
+    BACKSTORY = """You are a seasoned regulatory compliance expert with 20+ years of experience in 
             telecommunications and satellite licensing. You have expertise in:
             - FCC licensing and compliance (Part 25, Part 5)
             - ITU Radio Regulations and coordination
@@ -26,11 +353,49 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
             - ITAR and export control compliance
             - Environmental impact assessments (NEPA)
             - Cross-border data transfer regulations
-            You excel at navigating complex regulatory frameworks and ensuring operational compliance.""",
+            You excel at navigating complex regulatory frameworks and ensuring operational compliance."""
+    
+    # Static capability description merged into the LLM fallback context
+    CAPABILITY_CONTEXT = MappingProxyType({
+        "agent_capabilities": (
+            "FCC and ITU licensing requirements analysis",
+            "Spectrum coordination and frequency planning",
+            "ITAR and export control compliance",
+            "Environmental and safety assessments",
+            "Regulatory filing preparation and submission",
+            "Compliance audits and monitoring"
+        ),
+        "analysis_types": (
+            "Licensing requirements and application processes",
+            "Frequency coordination and interference analysis",
+            "Regulatory compliance gap assessments",
+            "International treaty and agreement compliance",
+            "Environmental impact and zoning compliance",
+            "Operational compliance monitoring and reporting"
+        )
+    })
+    
+    # (LLM client, CrewAI agent) built by the first instance; later instances
+    # reuse them instead of repeating the client setup and Agent validation
+    _shared_agent: ClassVar[Optional[Tuple[Any, Agent]]] = None
+    
+    def __init__(self):
+        shared = RegulatoryComplianceAgent._shared_agent
+        if shared is not None:
+            self.llm, self.agent = shared
+            self.role = self.ROLE
+            self.goal = self.GOAL
+            return
+        
+        super().__init__(
+            role=self.ROLE,
+            goal=self.GOAL,
+            backstory=self.BACKSTORY,
             verbose=True,
             allow_delegation=False,
             tools=[]
         )
+        RegulatoryComplianceAgent._shared_agent = (self.llm, self.agent)
         
     def licensing_requirements_analysis(self,
                                       station_type: str,
@@ -102,8 +467,11 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
                         last_audit_date: Optional[str] = None) -> Dict[str, Any]:
         """Perform comprehensive compliance audit"""
         
+        # One reference time for the whole audit
+        now = datetime.now()
+        
         audit_results = {
-            "audit_date": datetime.now().isoformat(),
+            "audit_date": now.isoformat(),
             "overall_status": "Compliant",
             "findings": [],
             "risks": [],
@@ -114,37 +482,43 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         for license in current_licenses:
             expiry = license.get("expiry_date")
             if expiry:
-                days_to_expiry = (datetime.fromisoformat(expiry) - datetime.now()).days
+                days_to_expiry = (_parse_iso_date(expiry) - now).days
                 if days_to_expiry < 0:
-                    audit_results["findings"].append({
-                        "severity": "Critical",
-                        "issue": f"License {license['number']} expired",
-                        "action": "Immediate renewal required"
-                    })
+                    audit_results["findings"].append(Finding(
+                        severity="Critical",
+                        issue=f"License {license['number']} expired",
+                        action="Immediate renewal required"
+                    ))
                     audit_results["overall_status"] = "Non-Compliant"
                 elif days_to_expiry < 90:
-                    audit_results["findings"].append({
-                        "severity": "High",
-                        "issue": f"License {license['number']} expires in {days_to_expiry} days",
-                        "action": "Initiate renewal process"
-                    })
+                    audit_results["findings"].append(Finding(
+                        severity="High",
+                        issue=f"License {license['number']} expires in {days_to_expiry} days",
+                        action="Initiate renewal process"
+                    ))
         
         # Operational compliance check
-        operational_compliance = self._check_operational_compliance(operations)
-        audit_results["findings"].extend(operational_compliance)
+        self._check_operational_compliance(operations, audit_results["findings"])
         
         # Technical compliance
-        technical_compliance = self._check_technical_compliance(operations)
-        audit_results["findings"].extend(technical_compliance)
+        self._check_technical_compliance(operations, audit_results["findings"])
+        
+        # Severity tally shared by the risk assessment and the score
+        findings = audit_results["findings"]
+        severity_counts = Counter(f.severity for f in findings)
         
         # Risk assessment
-        audit_results["risks"] = self._assess_compliance_risks(audit_results["findings"])
+        risks = self._assess_compliance_risks(severity_counts, len(findings))
+        audit_results["risks"] = [risk.to_dict() for risk in risks]
         
         # Generate action plan
-        audit_results["required_actions"] = self._generate_action_plan(audit_results["findings"])
+        actions = self._generate_action_plan(findings)
+        audit_results["required_actions"] = [action.to_dict() for action in actions]
         
         # Compliance score
-        audit_results["compliance_score"] = self._calculate_compliance_score(audit_results["findings"])
+        audit_results["compliance_score"] = self._calculate_compliance_score(severity_counts)
+        
+        audit_results["findings"] = [finding.to_dict() for finding in findings]
         
         return audit_results
     
@@ -168,22 +542,33 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         if frequency < 15000:  # C and Ku band typically require coordination
             coordination_result["coordination_required"] = True
         
-        # Identify affected operators
-        for operator in existing_operators:
-            op_freq = operator.get("frequency", 0)
-            op_bw = operator.get("bandwidth", 0)
+        # Identify affected operators: the frequency overlap test runs over stacked
+        # arrays, and locations are only read for the operators that overlap
+        if existing_operators:
+            np = lazy_import("numpy")
+            n = len(existing_operators)
+            op_freqs = np.fromiter((o.get("frequency", 0) for o in existing_operators), dtype=np.float64, count=n)
+            op_bws = np.fromiter((o.get("bandwidth", 0) for o in existing_operators), dtype=np.float64, count=n)
             
             # Check frequency overlap or adjacency
-            if abs(op_freq - frequency) < (bandwidth + op_bw) / 2:
-                distance = self._calculate_distance(location, operator.get("location", {}))
-                
-                affected = {
-                    "operator": operator["name"],
-                    "frequency_separation_mhz": abs(op_freq - frequency),
-                    "distance_km": distance,
-                    "interference_potential": "High" if distance < 100 else "Medium" if distance < 500 else "Low"
-                }
-                coordination_result["affected_operators"].append(affected)
+            overlapping = np.flatnonzero(np.abs(op_freqs - frequency) < (bandwidth + op_bws) / 2).tolist()
+            affected_operators = [existing_operators[i] for i in overlapping]
+            
+            # Simplified distance calculation, rough km conversion
+            op_locations = [o.get("location", {}) for o in affected_operators]
+            dlat = np.fromiter((loc.get("latitude", 0) for loc in op_locations),
+                               dtype=np.float64, count=len(op_locations)) - location.get("latitude", 0)
+            dlon = np.fromiter((loc.get("longitude", 0) for loc in op_locations),
+                               dtype=np.float64, count=len(op_locations)) - location.get("longitude", 0)
+            distances = (np.sqrt(dlat * dlat + dlon * dlon) * 111).tolist()
+            
+            for operator, distance in zip(affected_operators, distances):
+                coordination_result["affected_operators"].append(AffectedOperator(
+                    operator=operator["name"],
+                    frequency_separation_mhz=abs(operator.get("frequency", 0) - frequency),
+                    distance_km=distance,
+                    interference_potential=INTERFERENCE_LABELS[bisect_right(INTERFERENCE_DISTANCE_BREAKS_KM, distance)]
+                ))
         
         # Interference analysis
         coordination_result["interference_analysis"] = self._perform_interference_analysis(
@@ -192,19 +577,14 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         
         # Mitigation measures
         if coordination_result["affected_operators"]:
-            coordination_result["mitigation_measures"] = [
-                "Implement frequency offset",
-                "Use orthogonal polarization",
-                "Antenna pattern optimization",
-                "Power flux density limits",
-                "Time-based coordination"
-            ]
+            coordination_result["mitigation_measures"] = list(INTERFERENCE_MITIGATION_MEASURES)
         
         # Coordination process
         coordination_result["coordination_process"] = self._outline_coordination_process(
             coordination_result["affected_operators"]
         )
         
+        coordination_result["affected_operators"] = [op.to_dict() for op in coordination_result["affected_operators"]]
         return coordination_result
     
     def itar_compliance_check(self,
@@ -224,8 +604,7 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         
         # Check equipment for USML items
         for equipment in equipment_list:
-            category = equipment.get("category", "")
-            if any(controlled in category.lower() for controlled in ["military", "defense", "crypto"]):
+            if ITAR_PATTERN.search(equipment.get("category", "")):
                 compliance_check["itar_applicable"] = True
                 compliance_check["controlled_items"].append({
                     "item": equipment["name"],
@@ -235,18 +614,21 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         
         # Check data types
         for data_type in data_types:
-            if any(sensitive in data_type.lower() for sensitive in ["military", "intelligence", "classified"]):
+            if SENSITIVE_DATA_PATTERN.search(data_type):
                 compliance_check["restrictions"].append(f"Restricted data type: {data_type}")
                 compliance_check["compliance_status"] = "Review Required"
         
         # Check international partners
-        embargoed_countries = ["Iran", "North Korea", "Syria", "Cuba"]
-        for partner in international_partners:
-            if any(country in partner for country in embargoed_countries):
-                compliance_check["restrictions"].append(f"Embargoed country: {partner}")
-                compliance_check["compliance_status"] = "Non-Compliant"
-            elif partner not in ["Canada", "UK", "Australia", "Japan"]:
-                compliance_check["licensing_required"].append(f"Export license for {partner}")
+        embargoed = [partner for partner in international_partners if EMBARGOED_PATTERN.search(partner)]
+        if embargoed:
+            compliance_check["restrictions"].extend(f"Embargoed country: {partner}" for partner in embargoed)
+            compliance_check["compliance_status"] = "Non-Compliant"
+        
+        # Everyone else needs a license unless allied
+        cleared = ALLIED_PARTNERS.union(embargoed)
+        compliance_check["licensing_required"].extend(
+            f"Export license for {partner}" for partner in international_partners if partner not in cleared
+        )
         
         # Generate compliance requirements
         compliance_check["requirements"] = self._generate_export_requirements(compliance_check)
@@ -344,16 +726,11 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
             ])
             compliance_requirements["risk_level"] = "Medium"
         
-        # Data type specific requirements
-        for data_type in data_types:
-            if "personal" in data_type.lower() or "pii" in data_type.lower():
-                compliance_requirements["controls_needed"].extend([
-                    "Encryption at rest and in transit",
-                    "Access controls and authentication",
-                    "Data retention policies",
-                    "Breach notification procedures"
-                ])
-                compliance_requirements["risk_level"] = "High"
+        # Data type specific requirements: the controls apply once, however
+        # many personal data types are listed
+        if any(PERSONAL_DATA_PATTERN.search(data_type) for data_type in data_types):
+            compliance_requirements["controls_needed"].extend(PERSONAL_DATA_CONTROLS)
+            compliance_requirements["risk_level"] = "High"
         
         # Generate compliance roadmap
         compliance_requirements["implementation_roadmap"] = self._create_privacy_roadmap(compliance_requirements)
@@ -376,35 +753,12 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         }
         
         if filing_type == "FCC_earth_station":
-            filing_guide["forms_required"] = ["FCC Form 312", "Schedule B"]
-            filing_guide["supporting_documents"] = [
-                "Frequency coordination report",
-                "Radiation hazard study",
-                "FAA determination",
-                "Site drawings and maps"
-            ]
+            filing_guide["forms_required"] = list(FCC_EARTH_STATION_FORMS)
+            filing_guide["supporting_documents"] = list(FCC_EARTH_STATION_DOCUMENTS)
             filing_guide["fees"] = 9480  # Current FCC fee
             filing_guide["processing_time"] = "60-180 days"
-            
-            filing_guide["step_by_step_guide"] = [
-                "1. Create IBFS account at fcc.gov",
-                "2. Complete frequency coordination",
-                "3. Prepare technical exhibits",
-                "4. Complete Form 312 Main Form",
-                "5. Complete Schedule B technical details",
-                "6. Upload supporting documents",
-                "7. Pay filing fee",
-                "8. Submit and monitor for acceptance",
-                "9. Respond to any FCC inquiries",
-                "10. Receive grant or denial"
-            ]
-            
-            filing_guide["common_mistakes"] = [
-                "Incomplete frequency coordination",
-                "Missing radiation hazard analysis",
-                "Incorrect antenna gain patterns",
-                "Mismatched coordinates formats"
-            ]
+            filing_guide["step_by_step_guide"] = list(FCC_EARTH_STATION_STEPS)
+            filing_guide["common_mistakes"] = list(FCC_EARTH_STATION_MISTAKES)
         
         # Generate filing checklist
         filing_guide["prefiling_checklist"] = self._generate_filing_checklist(filing_type, station_details)
@@ -420,72 +774,39 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         requirements = {}
         
         for band in bands:
-            if "C-band" in band:
-                requirements[band] = {
-                    "coordination": "Required with terrestrial services",
-                    "special_conditions": "5G interference mitigation may be required",
-                    "power_limits": "EIRP density limits apply"
-                }
-            elif "Ka-band" in band:
-                requirements[band] = {
-                    "coordination": "Simplified for FSS",
-                    "special_conditions": "Rain fade mitigation plans required",
-                    "power_limits": "Standard FSS limits"
-                }
-            elif "Ku-band" in band:
-                requirements[band] = {
-                    "coordination": "Required with adjacent satellites",
-                    "special_conditions": "Two-degree spacing compliance",
-                    "power_limits": "Off-axis EIRP limits"
-                }
+            for key, band_requirements in BAND_REQUIREMENTS:
+                if key in band:
+                    requirements[band] = dict(band_requirements)
+                    break
         
         return requirements
     
     def _assess_coordination_requirements(self, location: Dict, bands: List[str]) -> Dict[str, Any]:
         """Assess coordination requirements based on location and bands"""
-        coordination = {
-            "domestic": [],
-            "international": [],
-            "timeline": "3-6 months"
-        }
-        
         # Check for border proximity (simplified)
         lat = location.get("latitude", 0)
         lon = location.get("longitude", 0)
         
-        # US-Canada border
-        if 48 < lat < 50 and -125 < lon < -65:
-            coordination["international"].append("Canada coordination required")
-        
-        # US-Mexico border
-        if 25 < lat < 33 and -120 < lon < -95:
-            coordination["international"].append("Mexico coordination required")
-        
-        # Domestic coordination
-        for band in bands:
-            if "C-band" in band or "Ku-band" in band:
-                coordination["domestic"].append(f"Coordination required for {band}")
-        
-        return coordination
+        return {
+            "domestic": [
+                f"Coordination required for {band}"
+                for band in bands
+                if any(key in band for key in DOMESTIC_COORDINATION_BANDS)
+            ],
+            "international": [
+                note
+                for (lat_min, lat_max, lon_min, lon_max), note in BORDER_COORDINATION_ZONES
+                if lat_min < lat < lat_max and lon_min < lon < lon_max
+            ],
+            "timeline": "3-6 months"
+        }
     
     def _generate_compliance_checklist(self, station_type: str, service: str) -> List[Dict]:
         """Generate compliance checklist"""
-        checklist = [
-            {"item": "Station license current", "required": True, "status": "Pending"},
-            {"item": "Frequency coordination completed", "required": True, "status": "Pending"},
-            {"item": "Equipment type approved", "required": True, "status": "Pending"},
-            {"item": "RF exposure compliance", "required": True, "status": "Pending"},
-            {"item": "Site access secured", "required": True, "status": "Pending"},
-            {"item": "Insurance coverage adequate", "required": True, "status": "Pending"},
-            {"item": "Emergency procedures documented", "required": True, "status": "Pending"},
-            {"item": "Operator certifications current", "required": False, "status": "Pending"}
-        ]
+        checklist = [dict(item) for item in BASE_CHECKLIST]
         
         if station_type == "gateway":
-            checklist.extend([
-                {"item": "24/7 monitoring capability", "required": True, "status": "Pending"},
-                {"item": "Redundant power systems", "required": True, "status": "Pending"}
-            ])
+            checklist.extend(dict(item) for item in GATEWAY_CHECKLIST)
         
         return checklist
     
@@ -520,119 +841,98 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
         
         return recommendations
     
-    def _check_operational_compliance(self, operations: Dict) -> List[Dict]:
-        """Check operational compliance"""
-        findings = []
+    def _check_operational_compliance(self, operations: Dict, findings: List[Finding]) -> None:
+        """Check operational compliance, appending any findings to the audit's list"""
         
         # Check power levels
         if operations.get("power_level", 0) > operations.get("authorized_power", 1000):
-            findings.append({
-                "severity": "High",
-                "issue": "Operating above authorized power level",
-                "action": "Reduce power immediately"
-            })
+            findings.append(Finding(
+                severity="High",
+                issue="Operating above authorized power level",
+                action="Reduce power immediately"
+            ))
         
         # Check operating hours
         if operations.get("24_7_operation", False) and not operations.get("24_7_authorized", True):
-            findings.append({
-                "severity": "Medium",
-                "issue": "Operating outside authorized hours",
-                "action": "Modify operations or amend license"
-            })
-        
-        return findings
+            findings.append(Finding(
+                severity="Medium",
+                issue="Operating outside authorized hours",
+                action="Modify operations or amend license"
+            ))
     
-    def _check_technical_compliance(self, operations: Dict) -> List[Dict]:
-        """Check technical compliance"""
-        findings = []
+    def _check_technical_compliance(self, operations: Dict, findings: List[Finding]) -> None:
+        """Check technical compliance, appending any findings to the audit's list"""
         
         # Check emission limits
         if operations.get("out_of_band_emissions", 0) > -25:  # dBc
-            findings.append({
-                "severity": "High",
-                "issue": "Out-of-band emissions exceed limits",
-                "action": "Adjust filters or reduce power"
-            })
+            findings.append(Finding(
+                severity="High",
+                issue="Out-of-band emissions exceed limits",
+                action="Adjust filters or reduce power"
+            ))
         
         # Check frequency tolerance
         if operations.get("frequency_offset", 0) > 0.001:  # 1 kHz
-            findings.append({
-                "severity": "Medium",
-                "issue": "Frequency offset exceeds tolerance",
-                "action": "Calibrate frequency reference"
-            })
-        
-        return findings
+            findings.append(Finding(
+                severity="Medium",
+                issue="Frequency offset exceeds tolerance",
+                action="Calibrate frequency reference"
+            ))
     
-    def _assess_compliance_risks(self, findings: List[Dict]) -> List[Dict]:
-        """Assess compliance risks based on findings"""
+    def _assess_compliance_risks(self, severity_counts: Counter, total_findings: int) -> List[ComplianceRisk]:
+        """Assess compliance risks from the per-severity finding counts"""
         risks = []
         
-        critical_count = sum(1 for f in findings if f["severity"] == "Critical")
-        high_count = sum(1 for f in findings if f["severity"] == "High")
+        critical_count = severity_counts["Critical"]
+        high_count = severity_counts["High"]
         
         if critical_count > 0:
-            risks.append({
-                "risk": "License revocation",
-                "probability": "High",
-                "impact": "Severe"
-            })
+            risks.append(ComplianceRisk(
+                risk="License revocation",
+                probability="High",
+                impact="Severe"
+            ))
         
         if high_count > 2:
-            risks.append({
-                "risk": "Regulatory enforcement action",
-                "probability": "Medium",
-                "impact": "High"
-            })
-        
-        risks.append({
-            "risk": "Financial penalties",
-            "probability": "Low" if len(findings) < 3 else "Medium",
-            "impact": "Medium"
-        })
+            risks.append(ComplianceRisk(
+                risk="Regulatory enforcement action",
+                probability="Medium",
+                impact="High"
+            ))
+        
+        risks.append(ComplianceRisk(
+            risk="Financial penalties",
+            probability=PENALTY_PROBABILITY_LABELS[bisect_right(PENALTY_FINDING_BREAKS, total_findings)],
+            impact="Medium"
+        ))
         
         return risks
     
-    def _generate_action_plan(self, findings: List[Dict]) -> List[Dict]:
+    def _generate_action_plan(self, findings: List[Finding]) -> List[ActionItem]:
         """Generate action plan from findings"""
-        action_plan = []
-        
-        # Sort by severity
-        for severity in ["Critical", "High", "Medium", "Low"]:
-            for finding in findings:
-                if finding["severity"] == severity:
-                    action_plan.append({
-                        "priority": severity,
-                        "action": finding["action"],
-                        "timeline": "Immediate" if severity == "Critical" else "30 days" if severity == "High" else "60 days"
-                    })
-        
-        return action_plan
-    
-    def _calculate_compliance_score(self, findings: List[Dict]) -> float:
-        """Calculate overall compliance score"""
-        if not findings:
-            return 100.0
+        # One stable sort by severity; findings with an unknown severity are left out
+        ranked = sorted((f for f in findings if f.severity in SEVERITY_RANK),
+                        key=lambda f: SEVERITY_RANK[f.severity])
         
-        severity_weights = {"Critical": 25, "High": 15, "Medium": 5, "Low": 2}
-        total_deductions = sum(severity_weights.get(f["severity"], 0) for f in findings)
-        
-        return max(0, 100 - total_deductions)
+        return [
+            ActionItem(
+                priority=finding.severity,
+                action=finding.action,
+                timeline=SEVERITY_TIMELINE[finding.severity]
+            )
+            for finding in ranked
+        ]
     
-    def _calculate_distance(self, loc1: Dict, loc2: Dict) -> float:
-        """Calculate distance between two locations (simplified)"""
-        import math
-        
-        lat1, lon1 = loc1.get("latitude", 0), loc1.get("longitude", 0)
-        lat2, lon2 = loc2.get("latitude", 0), loc2.get("longitude", 0)
+    def _calculate_compliance_score(self, severity_counts: Counter) -> float:
+        """Calculate overall compliance score from the per-severity finding counts"""
+        if not severity_counts:
+            return 100.0
         
-        # Simplified distance calculation
-        lat_diff = abs(lat2 - lat1)
-        lon_diff = abs(lon2 - lon1)
+        total_deductions = sum(SEVERITY_WEIGHTS.get(severity, 0) * count for severity, count in severity_counts.items())
         
-        return math.sqrt(lat_diff**2 + lon_diff**2) * 111  # Rough km conversion
+        return max(0, 100 - total_deductions)
     
-    def _perform_interference_analysis(self, freq: float, bw: float, operators: List[Dict]) -> Dict:
+    def _perform_interference_analysis(self, freq: float, bw: float, operators: List[AffectedOperator]) -> Dict:
         """Perform interference analysis"""
         return {
             "c_i_ratio": "Acceptable" if len(operators) < 3 else "Review required",
@@ -640,23 +940,11 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
             "mitigation_required": len(operators) > 2
         }
     
-    def _outline_coordination_process(self, operators: List[Dict]) -> List[str]:
+    def _outline_coordination_process(self, operators: List[AffectedOperator]) -> List[str]:
         """Outline coordination process"""
-        process = []
-        
         if operators:
-            process.extend([
-                "1. Prepare technical showing",
-                "2. Submit to affected operators",
-                "3. 30-day response period",
-                "4. Negotiate interference mitigation",
-                "5. Document agreements",
-                "6. File with FCC"
-            ])
-        else:
-            process.append("No coordination required")
-        
-        return process
+            return list(COORDINATION_PROCESS)
+        return ["No coordination required"]
     
     def _generate_export_requirements(self, check: Dict) -> List[str]:
         """Generate export control requirements"""
@@ -713,151 +1001,55 @@ class RegulatoryComplianceAgent(BaseCrewAgent):
     
     def _create_privacy_roadmap(self, requirements: Dict) -> List[Dict]:
         """Create privacy compliance roadmap"""
-        return [
-            {
-                "phase": "Assessment",
-                "timeline": "Month 1",
-                "activities": ["Data inventory", "Gap analysis", "Risk assessment"]
-            },
-            {
-                "phase": "Implementation",
-                "timeline": "Months 2-3",
-                "activities": ["Policy updates", "Technical controls", "Training"]
-            },
-            {
-                "phase": "Validation",
-                "timeline": "Month 4",
-                "activities": ["Testing", "Audit", "Certification"]
-            }
-        ]
+        return [{**phase, "activities": list(phase["activities"])} for phase in PRIVACY_ROADMAP]
     
     def _generate_filing_checklist(self, filing_type: str, details: Dict) -> List[str]:
         """Generate pre-filing checklist"""
-        return [
-            "Technical parameters finalized",
-            "Coordination completed",
-            "Supporting documents prepared",
-            "Fee payment ready",
-            "Legal review completed"
-        ]
+        return list(FILING_CHECKLIST)
     
     def _get_filing_tips(self, filing_type: str) -> List[str]:
         """Get filing tips"""
-        return [
-            "File early to account for processing delays",
-            "Double-check all technical parameters",
-            "Maintain copies of all submissions",
-            "Monitor email for FCC correspondence",
-            "Consider expedited processing if time-critical"
-        ]
+        return list(FILING_TIPS)
     
     def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Execute a regulatory compliance task"""
-        try:
-            task_lower = task.lower()
-            
-            if "licensing" in task_lower or "license" in task_lower:
-                if context:
-                    result = self.licensing_requirements_analysis(
-                        context.get("station_type", "gateway"),
-                        context.get("location", {"country": "USA"}),
-                        context.get("frequency_bands", ["Ku-band"]),
-                        context.get("service_type", "FSS")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide station details for licensing analysis"
-            
-            elif "audit" in task_lower:
-                if context:
-                    result = self.compliance_audit(
-                        context.get("licenses", []),
-                        context.get("operations", {}),
-                        context.get("last_audit")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide current licenses and operations data"
-            
-            elif "spectrum" in task_lower or "coordination" in task_lower:
-                if context:
-                    result = self.spectrum_coordination(
-                        context.get("frequency", 14250),
-                        context.get("bandwidth", 36),
-                        context.get("location", {}),
-                        context.get("existing_operators", [])
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide frequency and location details"
-            
-            elif "itar" in task_lower or "export" in task_lower:
-                if context:
-                    result = self.itar_compliance_check(
-                        context.get("equipment", []),
-                        context.get("data_types", []),
-                        context.get("partners", [])
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide equipment and partner details"
-            
-            elif "environmental" in task_lower or "nepa" in task_lower:
-                if context:
-                    result = self.environmental_compliance(
-                        context.get("site_details", {}),
-                        context.get("antenna_specs", {})
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide site and antenna details"
-            
-            elif "privacy" in task_lower or "gdpr" in task_lower:
-                if context:
-                    result = self.data_privacy_compliance(
-                        context.get("data_types", []),
-                        context.get("jurisdictions", ["USA"]),
-                        context.get("cross_border", False)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide data handling details"
-            
-            elif "filing" in task_lower:
-                if context:
-                    result = self.filing_assistance(
-                        context.get("filing_type", "FCC_earth_station"),
-                        context.get("station_details", {})
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide filing type and station details"
+        return self._respond(_classify_task(task), task, context)
+    
+    def execute_batch(self, items: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[str]:
+        """Execute several regulatory tasks, returning one reply per (task, context) pair in order
+        
+        Identical analysis requests in the batch (same intent and arguments) are
+        analyzed and serialized once and share the reply.
+        """
+        answered: Dict[bytes, str] = {}
+        return [self._respond(_classify_task(task), task, context, answered) for task, context in items]
+    
+    def _respond(self, intent: Optional[str], task: str, context: Optional[Dict[str, Any]],
+                 answered: Optional[Dict[bytes, str]] = None) -> str:
+        """Reply to a classified task, reusing and recording replies in answered when given"""
+        # For general queries or context-aware responses, use the base LLM execution,
+        # which handles its own failures
+        if intent is None:
+            # Add regulatory compliance-specific context
+            enhanced_context = ChainMap(self.CAPABILITY_CONTEXT, context or _EMPTY_CONTEXT)
             
-            # For general queries or context-aware responses, use the base LLM execution  
-            else:
-                # Add regulatory compliance-specific context
-                enhanced_context = context.copy() if context else {}
-                enhanced_context.update({
-                    "agent_capabilities": [
-                        "FCC and ITU licensing requirements analysis",
-                        "Spectrum coordination and frequency planning",
-                        "ITAR and export control compliance", 
-                        "Environmental and safety assessments",
-                        "Regulatory filing preparation and submission",
-                        "Compliance audits and monitoring"
-                    ],
-                    "analysis_types": [
-                        "Licensing requirements and application processes",
-                        "Frequency coordination and interference analysis",
-                        "Regulatory compliance gap assessments",
-                        "International treaty and agreement compliance", 
-                        "Environmental impact and zoning compliance",
-                        "Operational compliance monitoring and reporting"
-                    ]
-                })
-                
-                # Use parent class LLM execution for natural language response
-                return super().execute(task, enhanced_context)
-                
-        except Exception as e:
-            return f"I apologize for the technical difficulty. As your Regulatory Compliance specialist, I help ensure your ground station operations meet all FCC, ITU, and international requirements. I can assist with licensing, spectrum coordination, ITAR compliance, and regulatory filings. What specific compliance matter can I help you with?"
\ No newline at end of file
+            # Use parent class LLM execution for natural language response
+            return super().execute(task, enhanced_context)
+        
+        method_name, extract, missing_message = TASK_DISPATCH[intent]
+        if not context:
+            return missing_message
+        
+        # Only malformed context data can fail an analysis
+        try:
+            args = extract(context)
+            key = _request_digest(intent, args) if answered is not None else None
+            if key is not None and key in answered:
+                return answered[key]
+            response = serialize_result(getattr(self, method_name)(*args))
+        except ANALYSIS_ERRORS:
+            return ANALYSIS_ERROR_REPLY
+        
+        if key is not None:
+            answered[key] = response
+        return response
\ No newline at end of file
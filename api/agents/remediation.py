@@ -2,44 +2,17 @@
 Remediation Agent using CrewAI
 """
 
-from .base_agent import BaseCrewAgent
-from crewai import Task
-from typing import Optional, Dict, Any
+from .base_agent import BaseCrewAgent, lazy_import
+from types import MappingProxyType
+from typing import Optional, Dict, Any, ClassVar, Tuple
 
-class RemediationAgent(BaseCrewAgent):
-    """Error diagnosis and remediation specialist agent"""
-    
-    def __init__(self):
-        super().__init__(
-            role="Senior Site Reliability Engineer",
-            goal="Diagnose issues, implement fixes, and prevent future problems",
-            backstory="""You are an experienced SRE with expertise in:
-            - Root cause analysis
-            - Incident response and resolution
-            - Automated remediation
-            - Disaster recovery
-            - System resilience
-            - Post-mortem analysis
-            You've handled critical production incidents and excel at quickly diagnosing 
-            problems and implementing effective fixes. You focus on both immediate 
-            resolution and long-term prevention through automation and improved practices.""",
-            verbose=True,
-            allow_delegation=False
-        )
-        
-        self.specializations = [
-            "error_diagnosis",
-            "auto_fix",
-            "rollback_procedures",
-            "disaster_recovery",
-            "preventive_measures"
-        ]
-    
-    def diagnose_error_task(self, error_info: str) -> Task:
-        """Create a task for error diagnosis"""
-        return Task(
-            description=f"""Diagnose the following error:
-            {error_info}
+# Task prompts by kind: (description template, expected output). Templates are
+# split once around their {details} slot, so building a task only joins the
+# caller's details between the two constant halves
+TASK_PROMPTS = MappingProxyType({
+    "diagnose_error": (
+        """Diagnose the following error:
+            {details}
             
             Analyze:
             1. Error symptoms and manifestation
@@ -49,15 +22,11 @@ class RemediationAgent(BaseCrewAgent):
             5. Timeline of events
             
             Provide detailed diagnosis with confidence level.""",
-            agent=self.agent,
-            expected_output="Root cause analysis with detailed diagnosis"
-        )
-    
-    def fix_issue_task(self, issue_info: str) -> Task:
-        """Create a task for implementing fixes"""
-        return Task(
-            description=f"""Implement fix for issue:
-            {issue_info}
+        "Root cause analysis with detailed diagnosis"
+    ),
+    "fix_issue": (
+        """Implement fix for issue:
+            {details}
             
             Provide:
             1. Step-by-step fix procedure
@@ -67,15 +36,11 @@ class RemediationAgent(BaseCrewAgent):
             5. Success criteria
             
             Include risk assessment and approval requirements.""",
-            agent=self.agent,
-            expected_output="Detailed fix implementation plan with validation steps"
-        )
-    
-    def create_runbook_task(self, scenario: str) -> Task:
-        """Create a task for runbook creation"""
-        return Task(
-            description=f"""Create operational runbook for:
-            {scenario}
+        "Detailed fix implementation plan with validation steps"
+    ),
+    "create_runbook": (
+        """Create operational runbook for:
+            {details}
             
             Include:
             1. Prerequisites and dependencies
@@ -85,15 +50,11 @@ class RemediationAgent(BaseCrewAgent):
             5. Recovery verification steps
             
             Make it clear and actionable for on-call engineers.""",
-            agent=self.agent,
-            expected_output="Complete runbook with clear procedures"
-        )
-    
-    def disaster_recovery_task(self, disaster_scenario: str) -> Task:
-        """Create a task for disaster recovery planning"""
-        return Task(
-            description=f"""Plan disaster recovery for:
-            {disaster_scenario}
+        "Complete runbook with clear procedures"
+    ),
+    "disaster_recovery": (
+        """Plan disaster recovery for:
+            {details}
             
             Design:
             1. Recovery objectives (RTO/RPO)
@@ -103,15 +64,11 @@ class RemediationAgent(BaseCrewAgent):
             5. Communication plan
             
             Provide complete DR plan with timelines.""",
-            agent=self.agent,
-            expected_output="Disaster recovery plan with procedures and timelines"
-        )
-    
-    def preventive_measures_task(self, incident_info: str) -> Task:
-        """Create a task for preventive measures"""
-        return Task(
-            description=f"""Recommend preventive measures based on:
-            {incident_info}
+        "Disaster recovery plan with procedures and timelines"
+    ),
+    "preventive_measures": (
+        """Recommend preventive measures based on:
+            {details}
             
             Suggest:
             1. System hardening steps
@@ -121,6 +78,73 @@ class RemediationAgent(BaseCrewAgent):
             5. Training requirements
             
             Prioritize by impact and implementation effort.""",
+        "Preventive measures plan with prioritization"
+    )
+})
+_TASK_PARTS = MappingProxyType({
+    kind: (*template.split("{details}"), expected_output)
+    for kind, (template, expected_output) in TASK_PROMPTS.items()
+})
+
+class RemediationAgent(BaseCrewAgent):
+    """Error diagnosis and remediation specialist agent"""
+    
+    ROLE = "Senior Site Reliability Engineer"
+    GOAL = "Diagnose issues, implement fixes, and prevent future problems"
+    BACKSTORY = """You are an experienced SRE with expertise in:
+            - Root cause analysis
+            - Incident response and resolution
+            - Automated remediation
+            - Disaster recovery
+            - System resilience
+            - Post-mortem analysis
+            You've handled critical production incidents and excel at quickly diagnosing 
+            problems and implementing effective fixes. You focus on both immediate 
+            resolution and long-term prevention through automation and improved practices."""
+    
+    # Capability tags, one immutable tuple shared by every instance
+    specializations: ClassVar[Tuple[str, ...]] = (
+        "error_diagnosis",
+        "auto_fix",
+        "rollback_procedures",
+        "disaster_recovery",
+        "preventive_measures"
+    )
+    
+    def __init__(self):
+        super().__init__(
+            role=self.ROLE,
+            goal=self.GOAL,
+            backstory=self.BACKSTORY,
+            verbose=True,
+            allow_delegation=False
+        )
+    
+    def _build_task(self, kind: str, details: str) -> "Task":
+        """Create a task of the given kind for the caller's details"""
+        head, tail, expected_output = _TASK_PARTS[kind]
+        return lazy_import("crewai").Task(
+            description=f"{head}{details}{tail}",
             agent=self.agent,
-            expected_output="Preventive measures plan with prioritization"
-        )
\ No newline at end of file
+            expected_output=expected_output
+        )
+    
+    def diagnose_error_task(self, error_info: str) -> "Task":
+        """Create a task for error diagnosis"""
+        return self._build_task("diagnose_error", error_info)
+    
+    def fix_issue_task(self, issue_info: str) -> "Task":
+        """Create a task for implementing fixes"""
+        return self._build_task("fix_issue", issue_info)
+    
+    def create_runbook_task(self, scenario: str) -> "Task":
+        """Create a task for runbook creation"""
+        return self._build_task("create_runbook", scenario)
+    
+    def disaster_recovery_task(self, disaster_scenario: str) -> "Task":
+        """Create a task for disaster recovery planning"""
+        return self._build_task("disaster_recovery", disaster_scenario)
+    
+    def preventive_measures_task(self, incident_info: str) -> "Task":
+        """Create a task for preventive measures"""
+        return self._build_task("preventive_measures", incident_info)
\ No newline at end of file
@@ -4,11 +4,383 @@ Specializes in satellite communications, orbital mechanics, and ground station o
 """
 
 from crewai import Agent
-from typing import Optional, Dict, Any, List, Tuple
+from typing import Optional, Dict, Any, Callable, List, Mapping, Tuple
+import asyncio
 import math
-import json
 from datetime import datetime, timedelta
-from .base_agent import BaseCrewAgent
+from bisect import bisect_left, bisect_right
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from functools import lru_cache
+from types import MappingProxyType
+from .base_agent import BaseCrewAgent, FallbackReply, build_keyword_classifier, lazy_import, serialize_result
+
+# Reply returned in place of an analysis that failed
+ANALYSIS_ERROR_REPLY = FallbackReply(
+    "I apologize for the technical difficulty. As your SATCOM Operations Expert, I specialize in satellite "
+    "communication systems, link budgets, orbital mechanics, and RF performance optimization. I can help "
+    "you analyze coverage patterns, optimize signal quality, and resolve interference issues. What specific "
+    "SATCOM analysis would you like me to perform?"
+)
+
+# Link-budget model terms known at import time: the free-space path loss
+# constant with the km and GHz scalings folded in, kTB noise for a 290 K,
+# 36 MHz transponder, and the Eb/N0 correction for a 50 Mbps carrier
+TRANSPONDER_BANDWIDTH_HZ = 36e6
+FSPL_CONSTANT_DB = 20 * math.log10(1e3 * 1e9 * 4 * math.pi / 3e8)
+NOISE_POWER_DBW = 10 * math.log10(1.38e-23 * 290 * TRANSPONDER_BANDWIDTH_HZ)
+EB_N0_CORRECTION_DB = 10 * math.log10(50e6 / TRANSPONDER_BANDWIDTH_HZ)
+REQUIRED_EB_N0_DB = 10  # Typical requirement for BER 10^-6
+
+# Threshold labels looked up with bisect_left: a value equal to a breakpoint
+# takes the label to its left, matching the original strict > comparisons
+LINK_MARGIN_BREAKS_DB = (0, 3)
+LINK_STATUS_LABELS = ("Poor", "Marginal", "Good")
+ACM_MARGIN_BREAKS_DB = (5, 10)
+ACM_BENEFIT_LABELS = ("Low", "Medium", "High")
+ACM_THROUGHPUT_GAINS = ("5%", "10%", "20%")
+INTERFERENCE_SEVERITY_BREAKS_DB = (5, 10, 15)
+INTERFERENCE_SEVERITY_LABELS = ("Low", "Medium", "High", "Critical")
+INTERFERENCE_RESPONSE_BREAKS_DB = (5, 10)
+MITIGATION_COMPLEXITY_LABELS = ("Low", "Medium", "High")
+MONITORING_INTERVALS = ("Daily", "Hourly", "Continuous")
+MONITORING_REPORTING = ("Daily reports", "Daily reports", "Automated alerts")
+
+# ITU allocations as closed [lower, upper] MHz ranges sorted by lower edge;
+# the last lower edge at or below a frequency picks the candidate range, and
+# frequencies outside every range resolve to UNALLOCATED_BAND
+ITU_BAND_LOWER_EDGES_MHZ = (3700, 5925, 11700, 14000, 17700)
+ITU_BAND_UPPER_EDGES_MHZ = (4200, 6425, 12700, 14500, 21200)
+ITU_BAND_RECORDS = (
+    MappingProxyType({"band": "C-band", "primary_service": "FSS Downlink"}),
+    MappingProxyType({"band": "C-band", "primary_service": "FSS Uplink"}),
+    MappingProxyType({"band": "Ku-band", "primary_service": "FSS/BSS"}),
+    MappingProxyType({"band": "Ku-band", "primary_service": "FSS Uplink"}),
+    MappingProxyType({"band": "Ka-band", "primary_service": "FSS"})
+)
+UNALLOCATED_BAND = MappingProxyType({"band": "Various", "primary_service": "Check ITU allocation"})
+
+def _itu_band_indices(frequencies_mhz: "np.ndarray") -> "np.ndarray":
+    """Index into ITU_BAND_RECORDS per frequency, len(ITU_BAND_RECORDS) where unallocated"""
+    np = lazy_import("numpy")
+    upper = np.asarray(ITU_BAND_UPPER_EDGES_MHZ, dtype=np.float64)
+    idx = np.searchsorted(np.asarray(ITU_BAND_LOWER_EDGES_MHZ, dtype=np.float64), frequencies_mhz, side="right") - 1
+    allocated = (idx >= 0) & (frequencies_mhz <= upper[np.maximum(idx, 0)])
+    return np.where(allocated, idx, len(ITU_BAND_RECORDS))
+
+def _orbit_geometry(satellite_altitude_km: float, min_elevation_angle: float) -> Tuple[float, float, float]:
+    """(orbital period min, coverage radius km, max slant range km) for a circular orbit"""
+    # Earth radius
+    earth_radius_km = 6371
+    
+    # Calculate orbital period (Kepler's third law)
+    orbital_radius_km = earth_radius_km + satellite_altitude_km
+    orbital_period_min = 2 * math.pi * math.sqrt((orbital_radius_km ** 3) / (398600.4418))  / 60
+    
+    # Calculate maximum coverage radius from satellite
+    horizon_angle = math.acos(earth_radius_km / orbital_radius_km)
+    coverage_radius_km = earth_radius_km * horizon_angle
+    
+    # Calculate visibility window based on minimum elevation. R * (cot(e) - cot(e + a))
+    # with sin(a) = R * sin(e) / r reduces to R^2 / (r * sin(e + a)), which avoids
+    # cancelling two large cotangents at low elevations
+    min_elev_rad = math.radians(min_elevation_angle)
+    nadir_offset_rad = math.asin(earth_radius_km * math.sin(min_elev_rad) / orbital_radius_km)
+    max_range_km = earth_radius_km ** 2 / (orbital_radius_km * math.sin(min_elev_rad + nadir_offset_rad))
+    
+    return orbital_period_min, coverage_radius_km, max_range_km
+
+# Labels indexed by the codes from _satcom_kernels.coverage_quality_level()
+COVERAGE_QUALITY_LABELS = ("Excellent", "Good", "Limited")
+
+# Interference risk labels, indexed by the risk codes in INTERFERENCE_RULES
+INTERFERENCE_RISK_LEVELS = ("Low", "Medium", "High")
+
+# Interference sources as closed [lower, upper] MHz ranges sorted by lower edge,
+# each with a risk code and its potential sources. A carrier's risk is the
+# highest among the ranges containing it; Low when there are none
+INTERFERENCE_RULES = (
+    (3700, 3980, 2, ("5G terrestrial networks",)),  # C-band 5G
+    (10000, 15000, 0, ("Rain scatter from adjacent satellites",)),  # Ku-band rain scatter
+    (math.nextafter(20000, math.inf), math.inf, 1,  # Ka-band and above
+     ("Atmospheric absorption", "Adjacent satellite interference")),
+)
+INTERFERENCE_RULE_LOWER_EDGES_MHZ = tuple(rule[0] for rule in INTERFERENCE_RULES)
+
+def _interference_risk_codes(frequencies_mhz: "np.ndarray") -> "np.ndarray":
+    """Interference risk code per frequency, consistent with _interference_profile()"""
+    np = lazy_import("numpy")
+    lower, upper, risk = (np.asarray([rule[k] for rule in INTERFERENCE_RULES], dtype=np.float64) for k in range(3))
+    frequencies = frequencies_mhz[..., None]
+    inside = (lower <= frequencies) & (frequencies <= upper)
+    return np.where(inside, risk, 0.0).max(axis=-1).astype(np.int8)
+
+INTERFERENCE_MITIGATION = ("Frequency coordination", "Site shielding", "Filtering")
+REGULATORY_FILINGS = ("FCC Form 312", "ITU BR filing", "Coordination agreements")
+
+# Availability of a single ground station chain, by contributing factor
+EQUIPMENT_AVAILABILITY = 0.999  # 99.9% equipment availability
+POWER_AVAILABILITY = 0.9999  # 99.99% with UPS and generator
+WEATHER_AVAILABILITY = MappingProxyType({
+    "C-band": 0.999,
+    "Ku-band": 0.995,
+    "Ka-band": 0.99,
+    "Q/V-band": 0.98
+})
+DEFAULT_WEATHER_AVAILABILITY = 0.995
+
+# Parallel chains per redundancy configuration; the site is down only when all are
+REDUNDANT_CHAINS = MappingProxyType({"None": 1, "1+1": 2, "2+1": 3})
+SITE_DIVERSITY_AVAILABILITY = 0.9999  # Assumes uncorrelated sites
+
+@lru_cache(maxsize=16)
+def _single_site_availability(frequency_band: str) -> Tuple[float, float]:
+    """(weather availability, single-site availability) for a frequency band"""
+    weather_impact = WEATHER_AVAILABILITY.get(frequency_band, DEFAULT_WEATHER_AVAILABILITY)
+    return weather_impact, EQUIPMENT_AVAILABILITY * POWER_AVAILABILITY * weather_impact
+
+# Relative cost of each redundancy configuration, normalized to 100 for a single chain
+BASE_REDUNDANCY_COST = 100
+REDUNDANCY_COSTS = MappingProxyType({
+    "None": BASE_REDUNDANCY_COST,
+    "1+1": BASE_REDUNDANCY_COST * 1.8,
+    "2+1": BASE_REDUNDANCY_COST * 2.5,
+    "Site Diversity": BASE_REDUNDANCY_COST * 3.2
+})
+
+# DVB-S2 ModCods as (name, spectral efficiency in bit/s/Hz, required C/N in dB)
+MODCOD_SCHEMES = (
+    ("QPSK 1/2", 1.0, 3.0),
+    ("QPSK 3/4", 1.5, 5.5),
+    ("8PSK 2/3", 2.0, 8.5),
+    ("8PSK 3/4", 2.25, 9.8),
+    ("16APSK 2/3", 2.67, 11.0),
+    ("16APSK 3/4", 3.0, 12.0),
+    ("32APSK 3/4", 3.75, 15.0)
+)
+
+# Stands in for the optimal ModCod when no scheme closes the link; recognized
+# by identity, so a scheme that happened to share its name can't be mistaken for it
+NO_MODCOD = MappingProxyType({"name": "None suitable", "recommendation": "Increase power or reduce throughput requirement"})
+
+@lru_cache(maxsize=1)
+def _modcod_table() -> "np.ndarray":
+    """MODCOD_SCHEMES as a read-only structured array, built on first use"""
+    np = lazy_import("numpy")
+    table = np.array(list(MODCOD_SCHEMES), dtype=[("name", "U12"), ("spectral_efficiency", "f8"), ("required_cn_db", "f8")])
+    table.flags.writeable = False
+    return table
+
+# Mitigation techniques per interference type, most effective first
+INTERFERENCE_STRATEGIES = MappingProxyType({
+    "adjacent_channel": (
+        "Increase channel spacing",
+        "Implement sharper filters",
+        "Use guard bands",
+        "Coordinate with adjacent operators"
+    ),
+    "co_channel": (
+        "Spatial isolation (antenna pointing)",
+        "Polarization isolation",
+        "Time division coordination",
+        "Power control coordination"
+    ),
+    "terrestrial": (
+        "Site shielding",
+        "Frequency coordination",
+        "Antenna sidelobe suppression",
+        "Notch filtering"
+    ),
+    "rain_scatter": (
+        "Site diversity",
+        "Uplink power control",
+        "Adaptive coding and modulation",
+        "Frequency diversity"
+    )
+})
+DEFAULT_INTERFERENCE_STRATEGIES = ("Consult regulatory authority",)
+INTERFERENCE_REGULATORY_ACTIONS = (
+    "File interference complaint if persistent",
+    "Request coordination meeting",
+    "Document interference patterns"
+)
+MONITORING_PARAMETERS = ("C/I ratio", "BER", "Es/N0", "Spectrum occupancy")
+
+@lru_cache(maxsize=512)
+def _interference_profile(frequency_mhz: float) -> Tuple[str, Tuple[str, ...]]:
+    """(risk level, potential sources) for a carrier frequency, memoized across coordination runs"""
+    risk = 0
+    sources = ()
+    # Only rules starting at or below the frequency can contain it
+    candidates = INTERFERENCE_RULES[:bisect_right(INTERFERENCE_RULE_LOWER_EDGES_MHZ, frequency_mhz)]
+    for _, upper, rule_risk, rule_sources in candidates:
+        if frequency_mhz <= upper:
+            risk = max(risk, rule_risk)
+            sources += rule_sources
+    return INTERFERENCE_RISK_LEVELS[risk], sources
+
+@lru_cache(maxsize=512)
+def _redundancy_cost_benefit(redundancy_type: str, availability: float) -> Tuple[float, str, str]:
+    """(relative cost, availability gain, cost per nine) for a redundancy configuration"""
+    return (
+        REDUNDANCY_COSTS.get(redundancy_type, BASE_REDUNDANCY_COST),
+        f"{(availability - 0.999) * 100:.3f}%",
+        "High" if redundancy_type == "Site Diversity" else "Medium"
+    )
+
+# Link budget recommendations per bucket: negative, marginal (below 3 dB) and
+# acceptable margin, then acceptable margin above 20 GHz
+LINK_RECOMMENDATIONS = (
+    ("CRITICAL: Link margin negative - immediate action required",
+     "Increase transmit power or antenna gain",
+     "Consider lower frequency band for better propagation"),
+    ("Link margin marginal - monitor closely",
+     "Implement uplink power control",
+     "Consider site diversity for critical services"),
+    ("Link margin acceptable",),
+    ("Link margin acceptable",
+     "Consider adaptive coding for Ka-band and above")
+)
+
+# Coverage recommendations indexed by 2 * (quality is Limited) + (fewer than 4 daily passes)
+COVERAGE_RECOMMENDATIONS = (
+    (),
+    ("Limited daily passes - consider MEO or GEO alternatives",
+     "Implement store-and-forward for non-real-time data"),
+    ("Consider higher inclination orbit for better coverage",
+     "Add additional ground stations for gap filling"),
+    ("Consider higher inclination orbit for better coverage",
+     "Add additional ground stations for gap filling",
+     "Limited daily passes - consider MEO or GEO alternatives",
+     "Implement store-and-forward for non-real-time data")
+)
+
+# Frequency coordination recommendations per interference risk level
+FREQUENCY_RECOMMENDATIONS = MappingProxyType({
+    "High": ("Immediate coordination required with existing operators",
+             "Consider alternative frequency bands",
+             "Implement interference monitoring system"),
+    "Medium": ("Standard coordination procedures recommended",
+               "Monitor for interference during commissioning",
+               "Document baseline RF environment"),
+    "Low": ("Standard filing procedures sufficient",
+            "Periodic monitoring recommended")
+})
+
+# Keywords looked for in a task
+TASK_TERMS = ("link budget", "orbital coverage", "coverage analysis", "frequency", "coordination",
+              "modulation", "modcod", "availability", "interference")
+
+# Intents in dispatch priority order, each with alternative keyword sets that
+# must all be present in the task
+TASK_RULES = (
+    ("link_budget", (frozenset({"link budget"}),)),
+    ("coverage", (frozenset({"orbital coverage"}), frozenset({"coverage analysis"}))),
+    ("frequency_coordination", (frozenset({"frequency", "coordination"}),)),
+    ("modcod", (frozenset({"modulation"}), frozenset({"modcod"}))),
+    ("availability", (frozenset({"availability"}),)),
+    ("interference", (frozenset({"interference"}),)),
+)
+
+@dataclass(slots=True)
+class LinkBudgetContext:
+    """Context keys read by a link budget task, with their defaults"""
+    frequency_ghz: float = 14.25
+    distance_km: float = 36000
+    tx_power_dbm: float = 30
+    tx_gain_dbi: float = 45
+    rx_gain_dbi: float = 35
+    rain_margin_db: float = 3
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class OrbitalCoverageContext:
+    """Context keys read by an orbital coverage task, with their defaults"""
+    altitude_km: float = 550
+    inclination: float = 53
+    lat: float = 40
+    lon: float = -74
+    min_elevation: float = 10
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class FrequencyCoordinationContext:
+    """Context keys read by a frequency coordination task, with their defaults"""
+    frequency_mhz: float = 3750
+    bandwidth_mhz: float = 36
+    service_type: str = "FSS"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class ModCodContext:
+    """Context keys read by a modulation and coding task, with their defaults"""
+    link_margin_db: float = 6
+    bandwidth_mhz: float = 36
+    throughput_mbps: float = 100
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class AvailabilityContext:
+    """Context keys read by a ground station availability task, with their defaults"""
+    location: Dict[str, float] = field(default_factory=lambda: {"lat": 40, "lon": -74})
+    frequency_band: str = "Ku-band"
+    redundancy: str = "1+1"
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+@dataclass(slots=True)
+class InterferenceContext:
+    """Context keys read by an interference mitigation task, with their defaults"""
+    type: str = "adjacent_channel"
+    frequency_mhz: float = 3750
+    level_db: float = 8
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+def _dispatch_entry(method_name: str, context_type: type, missing_message: str) -> Tuple[str, Callable, str]:
+    """Bundle a handler with a one-pass extractor for its positional arguments
+    
+    The argument keys and defaults are the context type's fields, in order.
+    The extractor binds the context's get once and maps it over them, so
+    contexts may carry keys for other tasks. Defaults are built once and
+    shared between calls; results built from them are only serialized, never
+    mutated.
+    """
+    keys = tuple(f.name for f in fields(context_type))
+    fallbacks = tuple(f.default if f.default is not MISSING else f.default_factory() for f in fields(context_type))
+    
+    def extract(context: Mapping[str, Any]) -> Tuple[Any, ...]:
+        return tuple(map(context.get, keys, fallbacks))
+    
+    return method_name, extract, missing_message
+
+# intent -> (handler, argument extractor, reply when no context is given)
+TASK_DISPATCH = MappingProxyType({
+    "link_budget": _dispatch_entry("calculate_link_budget", LinkBudgetContext,
+                                    "Please provide link parameters (frequency, distance, power, gains)"),
+    "coverage": _dispatch_entry("analyze_orbital_coverage", OrbitalCoverageContext,
+                                 "Please provide orbital parameters and ground station location"),
+    "frequency_coordination": _dispatch_entry("frequency_coordination_analysis", FrequencyCoordinationContext,
+                                               "Please provide frequency parameters for coordination analysis"),
+    "modcod": _dispatch_entry("modulation_coding_optimization", ModCodContext,
+                               "Please provide link margin and throughput requirements"),
+    "availability": _dispatch_entry("ground_station_availability", AvailabilityContext,
+                                     "Please provide location and redundancy configuration"),
+    "interference": _dispatch_entry("interference_mitigation_strategy", InterferenceContext,
+                                     "Please provide interference type and level"),
+})
+
+# Classifies a lower-cased task with one keyword scan and a table lookup
+_classify_task = build_keyword_classifier(TASK_TERMS, TASK_RULES)
 
 class SATCOMExpertAgent(BaseCrewAgent):
     """Expert agent for satellite communications and ground station operations"""
@@ -43,31 +415,21 @@ class SATCOMExpertAgent(BaseCrewAgent):
         """Calculate satellite link budget"""
         
         # Free space path loss (FSPL)
-        fspl_db = 20 * math.log10(distance_km * 1000) + 20 * math.log10(frequency_ghz * 1e9) + 20 * math.log10(4 * math.pi / 3e8)
-        
-        # Convert dBm to dBW
-        tx_power_dbw = tx_power_dbm - 30
+        fspl_db = 20 * math.log10(distance_km * frequency_ghz) + FSPL_CONSTANT_DB
         
-        # EIRP (Effective Isotropic Radiated Power)
-        eirp_dbw = tx_power_dbw + tx_gain_dbi
+        # EIRP (Effective Isotropic Radiated Power), transmit power converted from dBm to dBW
+        eirp_dbw = tx_power_dbm - 30 + tx_gain_dbi
         
         # Received power
         rx_power_dbw = eirp_dbw - fspl_db + rx_gain_dbi - rain_margin_db
         rx_power_dbm = rx_power_dbw + 30
         
-        # System noise temperature and C/N calculation
-        system_temp_k = 290  # Room temperature assumption
-        bandwidth_hz = 36e6  # Typical transponder bandwidth
-        noise_power_dbw = 10 * math.log10(1.38e-23 * system_temp_k * bandwidth_hz)
-        cn_ratio_db = rx_power_dbw - noise_power_dbw
-        
-        # Eb/N0 calculation (assuming QPSK)
-        data_rate_mbps = 50  # Typical data rate
-        eb_n0_db = cn_ratio_db - 10 * math.log10(data_rate_mbps * 1e6 / bandwidth_hz)
+        # C/N against the transponder noise floor, then Eb/N0 for the QPSK carrier
+        cn_ratio_db = rx_power_dbw - NOISE_POWER_DBW
+        eb_n0_db = cn_ratio_db - EB_N0_CORRECTION_DB
         
         # Link margin
-        required_eb_n0_db = 10  # Typical requirement for BER 10^-6
-        link_margin_db = eb_n0_db - required_eb_n0_db
+        link_margin_db = eb_n0_db - REQUIRED_EB_N0_DB
         
         return {
             "frequency_ghz": frequency_ghz,
@@ -78,10 +440,55 @@ class SATCOMExpertAgent(BaseCrewAgent):
             "cn_ratio_db": round(cn_ratio_db, 2),
             "eb_n0_db": round(eb_n0_db, 2),
             "link_margin_db": round(link_margin_db, 2),
-            "link_status": "Good" if link_margin_db > 3 else "Marginal" if link_margin_db > 0 else "Poor",
+            "link_status": LINK_STATUS_LABELS[bisect_left(LINK_MARGIN_BREAKS_DB, link_margin_db)],
             "recommendations": self._get_link_recommendations(link_margin_db, frequency_ghz)
         }
     
+    def link_budget_sweep(self,
+                          frequency_ghz,
+                          distance_km,
+                          tx_power_dbm=30,
+                          tx_gain_dbi=45,
+                          rx_gain_dbi=35,
+                          rain_margin_db=3) -> Dict[str, Any]:
+        """Link budget over a parameter grid, e.g. for link-margin contour maps
+        
+        Every argument may be a scalar or an array; they are broadcast against
+        each other and each result is a nested list of the broadcast shape.
+        """
+        from ._satcom_kernels import link_budget, link_status_level
+        np = lazy_import("numpy")
+        params = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (frequency_ghz, distance_km, tx_power_dbm, tx_gain_dbi, rx_gain_dbi, rain_margin_db)
+        ))
+        shape = params[0].shape
+        
+        # Kernels take flat contiguous arrays, which Numba compiles for any grid shape;
+        # non-positive distances or frequencies come out as -inf/NaN rather than warnings
+        flat = [np.ascontiguousarray(p).ravel() for p in params]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            budget = link_budget(*flat)
+        status = np.asarray(LINK_STATUS_LABELS)[link_status_level(budget[-1])].reshape(shape)
+        
+        # The kernel's outputs are fresh arrays, so they are rounded in place
+        fspl_db, eirp_dbw, rx_power_dbm, cn_ratio_db, eb_n0_db, link_margin_db = (
+            np.round(values, 2, out=values).reshape(shape).tolist() for values in budget
+        )
+        
+        return {
+            "shape": list(shape),
+            "frequency_ghz": params[0].tolist(),
+            "distance_km": params[1].tolist(),
+            "path_loss_db": fspl_db,
+            "eirp_dbw": eirp_dbw,
+            "received_power_dbm": rx_power_dbm,
+            "cn_ratio_db": cn_ratio_db,
+            "eb_n0_db": eb_n0_db,
+            "link_margin_db": link_margin_db,
+            "link_status": status.tolist()
+        }
+    
     def analyze_orbital_coverage(self,
                                 satellite_altitude_km: float,
                                 satellite_inclination: float,
@@ -90,22 +497,7 @@ class SATCOMExpertAgent(BaseCrewAgent):
                                 min_elevation_angle: float = 10) -> Dict[str, Any]:
         """Analyze satellite orbital coverage for a ground station"""
         
-        # Earth radius
-        earth_radius_km = 6371
-        
-        # Calculate orbital period (Kepler's third law)
-        orbital_radius_km = earth_radius_km + satellite_altitude_km
-        orbital_period_min = 2 * math.pi * math.sqrt((orbital_radius_km ** 3) / (398600.4418))  / 60
-        
-        # Calculate maximum coverage radius from satellite
-        horizon_angle = math.acos(earth_radius_km / orbital_radius_km)
-        coverage_radius_km = earth_radius_km * horizon_angle
-        
-        # Calculate visibility window based on minimum elevation
-        min_elev_rad = math.radians(min_elevation_angle)
-        max_range_km = earth_radius_km * (math.cos(min_elev_rad) / math.sin(min_elev_rad) - 
-                                         1 / math.tan(min_elev_rad + math.asin(earth_radius_km * 
-                                         math.sin(min_elev_rad) / orbital_radius_km)))
+        orbital_period_min, coverage_radius_km, max_range_km = _orbit_geometry(satellite_altitude_km, min_elevation_angle)
         
         # Estimate daily passes (simplified)
         daily_passes = int(1440 / orbital_period_min)  # Minutes per day / orbital period
@@ -139,6 +531,50 @@ class SATCOMExpertAgent(BaseCrewAgent):
             "recommendations": self._get_coverage_recommendations(coverage_quality, daily_passes)
         }
     
+    def analyze_orbital_coverage_batch(self,
+                                       satellite_altitude_km: float,
+                                       satellite_inclination: float,
+                                       ground_station_lats,
+                                       ground_station_lons,
+                                       min_elevation_angle: float = 10) -> Dict[str, Any]:
+        """Orbital coverage of one satellite for a set of candidate ground stations
+        
+        The orbit geometry is computed once; per-station results are returned
+        as parallel lists (one entry per station) under "ground_stations".
+        """
+        from ._satcom_kernels import coverage_quality_level, pass_visibility_minutes
+        np = lazy_import("numpy")
+        lats = np.asarray(ground_station_lats, dtype=np.float64)
+        lons = np.asarray(ground_station_lons, dtype=np.float64)
+        
+        orbital_period_min, coverage_radius_km, max_range_km = _orbit_geometry(satellite_altitude_km, min_elevation_angle)
+        daily_passes = int(1440 / orbital_period_min)
+        
+        flat_lats = np.ascontiguousarray(lats).ravel()
+        avg_visibility_min = pass_visibility_minutes(orbital_period_min, satellite_inclination, flat_lats).reshape(lats.shape)
+        quality = np.asarray(COVERAGE_QUALITY_LABELS)[coverage_quality_level(satellite_inclination, flat_lats)].reshape(lats.shape)
+        
+        return {
+            "satellite": {
+                "altitude_km": satellite_altitude_km,
+                "inclination_degrees": satellite_inclination,
+                "orbital_period_minutes": round(orbital_period_min, 2),
+                "coverage_radius_km": round(coverage_radius_km, 2)
+            },
+            "coverage_analysis": {
+                "min_elevation_angle": min_elevation_angle,
+                "daily_passes": daily_passes,
+                "max_range_km": round(max_range_km, 2)
+            },
+            "ground_stations": {
+                "latitude": lats.tolist(),
+                "longitude": lons.tolist(),
+                "avg_visibility_minutes": np.round(avg_visibility_min, 2).tolist(),
+                "coverage_quality": quality.tolist(),
+                "total_daily_coverage_minutes": np.round(daily_passes * avg_visibility_min, 2).tolist()
+            }
+        }
+    
     def frequency_coordination_analysis(self,
                                       center_frequency_mhz: float,
                                       bandwidth_mhz: float,
@@ -175,41 +611,90 @@ class SATCOMExpertAgent(BaseCrewAgent):
             "recommendations": self._get_frequency_recommendations(interferers["risk_level"])
         }
     
+    def scan_frequency_block(self,
+                             start_mhz: float,
+                             end_mhz: float,
+                             bandwidth_mhz: float,
+                             service_type: str = "FSS",
+                             coarse_step_mhz: float = 50,
+                             fine_step_mhz: float = 5) -> Dict[str, Any]:
+        """Lowest-risk carrier frequencies within a spectrum block
+        
+        A coarse pass over [start_mhz, end_mhz) rates interference risk every
+        coarse_step_mhz; only the windows around coarse points below High risk
+        are then rescanned at fine_step_mhz, instead of the whole block.
+        """
+        np = lazy_import("numpy")
+        coarse = np.arange(start_mhz, end_mhz, coarse_step_mhz, dtype=np.float64)
+        promising = coarse[_interference_risk_codes(coarse) < 2]
+        
+        # Refine within one coarse step either side of each promising point
+        offsets = np.arange(-coarse_step_mhz, coarse_step_mhz, fine_step_mhz, dtype=np.float64)
+        fine = np.unique((promising[:, None] + offsets).ravel())
+        fine = fine[(fine >= start_mhz) & (fine < end_mhz)]
+        
+        risk = _interference_risk_codes(fine)
+        best_risk = int(risk.min()) if fine.size else 2
+        candidates = fine[risk == best_risk]
+        bands = _itu_band_indices(candidates).tolist()
+        records = ITU_BAND_RECORDS + (UNALLOCATED_BAND,)
+        
+        return {
+            "block": {
+                "start_mhz": start_mhz,
+                "end_mhz": end_mhz,
+                "bandwidth_mhz": bandwidth_mhz,
+                "service_type": service_type
+            },
+            "evaluations": {
+                "coarse": int(coarse.size),
+                "fine": int(fine.size)
+            },
+            "risk_level": INTERFERENCE_RISK_LEVELS[best_risk],
+            "candidates": [
+                {
+                    "center_frequency_mhz": frequency,
+                    "itu_band": records[band]["band"],
+                    "primary_allocation": records[band]["primary_service"],
+                    "coordination_required": frequency < 15000
+                }
+                for frequency, band in zip(candidates.tolist(), bands)
+            ],
+            "recommendations": self._get_frequency_recommendations(INTERFERENCE_RISK_LEVELS[best_risk])
+        }
+    
     def modulation_coding_optimization(self,
                                       link_margin_db: float,
                                       bandwidth_mhz: float,
                                       required_throughput_mbps: float) -> Dict[str, Any]:
         """Optimize modulation and coding schemes for given link conditions"""
         
-        modcod_schemes = [
-            {"name": "QPSK 1/2", "spectral_efficiency": 1.0, "required_cn_db": 3.0},
-            {"name": "QPSK 3/4", "spectral_efficiency": 1.5, "required_cn_db": 5.5},
-            {"name": "8PSK 2/3", "spectral_efficiency": 2.0, "required_cn_db": 8.5},
-            {"name": "8PSK 3/4", "spectral_efficiency": 2.25, "required_cn_db": 9.8},
-            {"name": "16APSK 2/3", "spectral_efficiency": 2.67, "required_cn_db": 11.0},
-            {"name": "16APSK 3/4", "spectral_efficiency": 3.0, "required_cn_db": 12.0},
-            {"name": "32APSK 3/4", "spectral_efficiency": 3.75, "required_cn_db": 15.0}
-        ]
+        table = _modcod_table()
         
         # Find suitable modcod schemes
-        suitable_schemes = []
-        for scheme in modcod_schemes:
-            achievable_throughput = bandwidth_mhz * scheme["spectral_efficiency"]
-            if achievable_throughput >= required_throughput_mbps and link_margin_db >= scheme["required_cn_db"]:
-                suitable_schemes.append({
-                    **scheme,
-                    "achievable_throughput_mbps": round(achievable_throughput, 2),
-                    "margin_db": round(link_margin_db - scheme["required_cn_db"], 2)
-                })
+        achievable = bandwidth_mhz * table["spectral_efficiency"]
+        suitable = (achievable >= required_throughput_mbps) & (link_margin_db >= table["required_cn_db"])
+        suitable_schemes = [
+            {
+                "name": name,
+                "spectral_efficiency": efficiency,
+                "required_cn_db": required_cn_db,
+                "achievable_throughput_mbps": round(achievable_throughput, 2),
+                "margin_db": round(link_margin_db - required_cn_db, 2)
+            }
+            for (name, efficiency, required_cn_db), achievable_throughput, ok
+            in zip(MODCOD_SCHEMES, achievable.tolist(), suitable.tolist())
+            if ok
+        ]
         
         # Select optimal scheme
         if suitable_schemes:
             optimal = max(suitable_schemes, key=lambda x: x["spectral_efficiency"])
         else:
-            optimal = {"name": "None suitable", "recommendation": "Increase power or reduce throughput requirement"}
+            optimal = NO_MODCOD
         
         # ACM recommendation
-        acm_benefit = "High" if link_margin_db > 10 else "Medium" if link_margin_db > 5 else "Low"
+        acm_level = bisect_left(ACM_MARGIN_BREAKS_DB, link_margin_db)
         
         return {
             "link_conditions": {
@@ -217,46 +702,64 @@ class SATCOMExpertAgent(BaseCrewAgent):
                 "bandwidth_mhz": bandwidth_mhz,
                 "required_throughput_mbps": required_throughput_mbps
             },
-            "optimal_modcod": optimal,
+            "optimal_modcod": dict(optimal),
             "alternative_schemes": suitable_schemes[:3] if len(suitable_schemes) > 1 else [],
             "adaptive_coding": {
-                "recommended": acm_benefit != "Low",
-                "expected_benefit": acm_benefit,
-                "throughput_improvement": f"{20 if acm_benefit == 'High' else 10 if acm_benefit == 'Medium' else 5}%"
+                "recommended": acm_level > 0,
+                "expected_benefit": ACM_BENEFIT_LABELS[acm_level],
+                "throughput_improvement": ACM_THROUGHPUT_GAINS[acm_level]
             },
             "recommendations": self._get_modcod_recommendations(optimal, link_margin_db)
         }
     
+    def modulation_coding_batch(self,
+                                link_margin_db,
+                                bandwidth_mhz,
+                                required_throughput_mbps) -> Dict[str, Any]:
+        """Optimal ModCod per (margin, bandwidth, throughput), e.g. over a link-budget sweep
+        
+        Arguments may be scalars or arrays and are broadcast against each
+        other; each result is a nested list of the broadcast shape, with
+        "None suitable" and zero throughput where no scheme closes the link.
+        """
+        np = lazy_import("numpy")
+        table = _modcod_table()
+        margin, bandwidth, throughput = np.broadcast_arrays(*(
+            np.asarray(value, dtype=np.float64)
+            for value in (link_margin_db, bandwidth_mhz, required_throughput_mbps)
+        ))
+        
+        achievable = bandwidth[..., None] * table["spectral_efficiency"]
+        suitable = (achievable >= throughput[..., None]) & (margin[..., None] >= table["required_cn_db"])
+        best = np.argmax(np.where(suitable, table["spectral_efficiency"], -1.0), axis=-1)
+        found = suitable.any(axis=-1)
+        
+        return {
+            "shape": list(margin.shape),
+            "optimal_modcod": np.where(found, table["name"][best], NO_MODCOD["name"]).tolist(),
+            "spectral_efficiency": np.where(found, table["spectral_efficiency"][best], 0.0).tolist(),
+            "achievable_throughput_mbps": np.round(
+                np.where(found, np.take_along_axis(achievable, best[..., None], axis=-1)[..., 0], 0.0), 2
+            ).tolist()
+        }
+    
     def ground_station_availability(self,
                                    location: Dict[str, float],
                                    frequency_band: str,
                                    redundancy_type: str = "1+1") -> Dict[str, Any]:
         """Calculate ground station availability and redundancy requirements"""
         
-        # Base availability factors
-        equipment_availability = 0.999  # 99.9% equipment availability
-        power_availability = 0.9999  # 99.99% with UPS and generator
-        
-        # Weather impact based on frequency band
-        weather_impact = {
-            "C-band": 0.999,
-            "Ku-band": 0.995,
-            "Ka-band": 0.99,
-            "Q/V-band": 0.98
-        }.get(frequency_band, 0.995)
-        
-        # Calculate single site availability
-        single_site_availability = equipment_availability * power_availability * weather_impact
-        
-        # Redundancy calculations
-        redundancy_configs = {
-            "None": single_site_availability,
-            "1+1": 1 - (1 - single_site_availability) ** 2,
-            "2+1": 1 - (1 - single_site_availability) ** 3,
-            "Site Diversity": 0.9999  # Assumes uncorrelated sites
-        }
+        # Weather impact based on frequency band, and the single site availability it allows
+        weather_impact, single_site_availability = _single_site_availability(frequency_band)
         
-        total_availability = redundancy_configs.get(redundancy_type, single_site_availability)
+        # Redundancy calculation for the requested configuration only
+        chains = REDUNDANT_CHAINS.get(redundancy_type, 1)
+        if redundancy_type == "Site Diversity":
+            total_availability = SITE_DIVERSITY_AVAILABILITY
+        elif chains > 1:
+            total_availability = 1 - (1 - single_site_availability) ** chains
+        else:
+            total_availability = single_site_availability
         annual_downtime_hours = (1 - total_availability) * 8760
         
         return {
@@ -270,8 +773,8 @@ class SATCOMExpertAgent(BaseCrewAgent):
                 "monthly_downtime_minutes": round(annual_downtime_hours * 60 / 12, 2)
             },
             "contributing_factors": {
-                "equipment": f"{equipment_availability * 100:.2f}%",
-                "power": f"{power_availability * 100:.2f}%",
+                "equipment": f"{EQUIPMENT_AVAILABILITY * 100:.2f}%",
+                "power": f"{POWER_AVAILABILITY * 100:.2f}%",
                 "weather": f"{weather_impact * 100:.2f}%"
             },
             "improvement_options": self._get_availability_improvements(total_availability, frequency_band),
@@ -284,40 +787,13 @@ class SATCOMExpertAgent(BaseCrewAgent):
                                         interference_level_db: float) -> Dict[str, Any]:
         """Develop interference mitigation strategies"""
         
-        strategies = {
-            "adjacent_channel": [
-                "Increase channel spacing",
-                "Implement sharper filters",
-                "Use guard bands",
-                "Coordinate with adjacent operators"
-            ],
-            "co_channel": [
-                "Spatial isolation (antenna pointing)",
-                "Polarization isolation",
-                "Time division coordination",
-                "Power control coordination"
-            ],
-            "terrestrial": [
-                "Site shielding",
-                "Frequency coordination",
-                "Antenna sidelobe suppression",
-                "Notch filtering"
-            ],
-            "rain_scatter": [
-                "Site diversity",
-                "Uplink power control",
-                "Adaptive coding and modulation",
-                "Frequency diversity"
-            ]
-        }
-        
-        mitigation_techniques = strategies.get(interference_type, ["Consult regulatory authority"])
+        mitigation_techniques = list(INTERFERENCE_STRATEGIES.get(interference_type, DEFAULT_INTERFERENCE_STRATEGIES))
         
         # Estimate mitigation effectiveness
         effectiveness = {
             "technique": mitigation_techniques[0] if mitigation_techniques else "None",
             "expected_improvement_db": min(interference_level_db * 0.7, 20),
-            "implementation_complexity": "High" if interference_level_db > 10 else "Medium" if interference_level_db > 5 else "Low"
+            "implementation_complexity": MITIGATION_COMPLEXITY_LABELS[bisect_left(INTERFERENCE_RESPONSE_BREAKS_DB, interference_level_db)]
         }
         
         return {
@@ -325,91 +801,40 @@ class SATCOMExpertAgent(BaseCrewAgent):
                 "type": interference_type,
                 "level_db": interference_level_db,
                 "frequency_mhz": frequency_mhz,
-                "severity": "Critical" if interference_level_db > 15 else "High" if interference_level_db > 10 else "Medium" if interference_level_db > 5 else "Low"
+                "severity": INTERFERENCE_SEVERITY_LABELS[bisect_left(INTERFERENCE_SEVERITY_BREAKS_DB, interference_level_db)]
             },
             "mitigation_strategies": mitigation_techniques,
             "primary_recommendation": effectiveness,
-            "regulatory_actions": [
-                "File interference complaint if persistent",
-                "Request coordination meeting",
-                "Document interference patterns"
-            ],
+            "regulatory_actions": list(INTERFERENCE_REGULATORY_ACTIONS),
             "monitoring_requirements": self._get_monitoring_requirements(interference_type, interference_level_db)
         }
     
     # Helper methods
     def _get_link_recommendations(self, margin_db: float, frequency_ghz: float) -> List[str]:
         """Get link budget improvement recommendations"""
-        recommendations = []
-        
-        if margin_db < 0:
-            recommendations.append("CRITICAL: Link margin negative - immediate action required")
-            recommendations.append("Increase transmit power or antenna gain")
-            recommendations.append("Consider lower frequency band for better propagation")
-        elif margin_db < 3:
-            recommendations.append("Link margin marginal - monitor closely")
-            recommendations.append("Implement uplink power control")
-            recommendations.append("Consider site diversity for critical services")
-        else:
-            recommendations.append("Link margin acceptable")
-            if frequency_ghz > 20:
-                recommendations.append("Consider adaptive coding for Ka-band and above")
-        
-        return recommendations
+        bucket = bisect_right(LINK_MARGIN_BREAKS_DB, margin_db)
+        if bucket == 2 and frequency_ghz > 20:
+            bucket = 3
+        return list(LINK_RECOMMENDATIONS[bucket])
     
     def _get_coverage_recommendations(self, quality: str, passes: int) -> List[str]:
         """Get orbital coverage recommendations"""
-        recommendations = []
-        
-        if quality == "Limited":
-            recommendations.append("Consider higher inclination orbit for better coverage")
-            recommendations.append("Add additional ground stations for gap filling")
-        
-        if passes < 4:
-            recommendations.append("Limited daily passes - consider MEO or GEO alternatives")
-            recommendations.append("Implement store-and-forward for non-real-time data")
-        
-        return recommendations
+        return list(COVERAGE_RECOMMENDATIONS[2 * (quality == "Limited") + (passes < 4)])
     
     def _get_itu_band_allocation(self, frequency_mhz: float) -> Dict[str, str]:
         """Get ITU band allocation for frequency"""
-        if 3700 <= frequency_mhz <= 4200:
-            return {"band": "C-band", "primary_service": "FSS Downlink"}
-        elif 5925 <= frequency_mhz <= 6425:
-            return {"band": "C-band", "primary_service": "FSS Uplink"}
-        elif 11700 <= frequency_mhz <= 12700:
-            return {"band": "Ku-band", "primary_service": "FSS/BSS"}
-        elif 14000 <= frequency_mhz <= 14500:
-            return {"band": "Ku-band", "primary_service": "FSS Uplink"}
-        elif 17700 <= frequency_mhz <= 21200:
-            return {"band": "Ka-band", "primary_service": "FSS"}
-        else:
-            return {"band": "Various", "primary_service": "Check ITU allocation"}
+        idx = bisect_right(ITU_BAND_LOWER_EDGES_MHZ, frequency_mhz) - 1
+        if idx >= 0 and frequency_mhz <= ITU_BAND_UPPER_EDGES_MHZ[idx]:
+            return dict(ITU_BAND_RECORDS[idx])
+        return dict(UNALLOCATED_BAND)
     
     def _identify_potential_interferers(self, frequency_mhz: float, bandwidth_mhz: float, service: str) -> Dict:
         """Identify potential interference sources"""
-        risk_level = "Low"
-        sources = []
-        
-        # C-band 5G interference
-        if 3700 <= frequency_mhz <= 3980:
-            risk_level = "High"
-            sources.append("5G terrestrial networks")
-        
-        # Ku-band rain scatter
-        if 10000 <= frequency_mhz <= 15000:
-            sources.append("Rain scatter from adjacent satellites")
-        
-        # Ka-band considerations
-        if frequency_mhz > 20000:
-            risk_level = "Medium"
-            sources.append("Atmospheric absorption")
-            sources.append("Adjacent satellite interference")
-        
+        risk_level, sources = _interference_profile(frequency_mhz)
         return {
             "risk_level": risk_level,
-            "sources": sources,
-            "mitigation": ["Frequency coordination", "Site shielding", "Filtering"]
+            "sources": list(sources),
+            "mitigation": list(INTERFERENCE_MITIGATION)
         }
     
     def _get_regulatory_requirements(self, frequency_mhz: float, service: str) -> Dict:
@@ -417,34 +842,18 @@ class SATCOMExpertAgent(BaseCrewAgent):
         return {
             "licensing": True,
             "coordination": frequency_mhz < 15000,
-            "filings": ["FCC Form 312", "ITU BR filing", "Coordination agreements"]
+            "filings": list(REGULATORY_FILINGS)
         }
     
     def _get_frequency_recommendations(self, risk_level: str) -> List[str]:
         """Get frequency coordination recommendations"""
-        if risk_level == "High":
-            return [
-                "Immediate coordination required with existing operators",
-                "Consider alternative frequency bands",
-                "Implement interference monitoring system"
-            ]
-        elif risk_level == "Medium":
-            return [
-                "Standard coordination procedures recommended",
-                "Monitor for interference during commissioning",
-                "Document baseline RF environment"
-            ]
-        else:
-            return [
-                "Standard filing procedures sufficient",
-                "Periodic monitoring recommended"
-            ]
+        return list(FREQUENCY_RECOMMENDATIONS.get(risk_level, FREQUENCY_RECOMMENDATIONS["Low"]))
     
-    def _get_modcod_recommendations(self, optimal: Dict, margin_db: float) -> List[str]:
+    def _get_modcod_recommendations(self, optimal: Mapping[str, Any], margin_db: float) -> List[str]:
         """Get modulation and coding recommendations"""
         recommendations = []
         
-        if "None suitable" in str(optimal.get("name", "")):
+        if optimal is NO_MODCOD:
             recommendations.append("No suitable ModCod - reduce throughput or improve link budget")
         else:
             recommendations.append(f"Implement {optimal.get('name')} for optimal efficiency")
@@ -470,108 +879,30 @@ class SATCOMExpertAgent(BaseCrewAgent):
     
     def _calculate_redundancy_cost_benefit(self, redundancy_type: str, availability: float) -> Dict:
         """Calculate cost-benefit of redundancy configuration"""
-        base_cost = 100  # Normalized
-        
-        costs = {
-            "None": base_cost,
-            "1+1": base_cost * 1.8,
-            "2+1": base_cost * 2.5,
-            "Site Diversity": base_cost * 3.2
-        }
-        
+        relative_cost, availability_gain, cost_per_nine = _redundancy_cost_benefit(redundancy_type, availability)
         return {
-            "relative_cost": costs.get(redundancy_type, base_cost),
-            "availability_gain": f"{(availability - 0.999) * 100:.3f}%",
-            "cost_per_nine": "High" if redundancy_type == "Site Diversity" else "Medium"
+            "relative_cost": relative_cost,
+            "availability_gain": availability_gain,
+            "cost_per_nine": cost_per_nine
         }
     
     def _get_monitoring_requirements(self, interference_type: str, level_db: float) -> Dict:
         """Get interference monitoring requirements"""
+        response_level = bisect_left(INTERFERENCE_RESPONSE_BREAKS_DB, level_db)
         return {
-            "monitoring_interval": "Continuous" if level_db > 10 else "Hourly" if level_db > 5 else "Daily",
-            "parameters": ["C/I ratio", "BER", "Es/N0", "Spectrum occupancy"],
-            "reporting": "Automated alerts" if level_db > 10 else "Daily reports",
+            "monitoring_interval": MONITORING_INTERVALS[response_level],
+            "parameters": list(MONITORING_PARAMETERS),
+            "reporting": MONITORING_REPORTING[response_level],
             "retention_period": "30 days minimum"
         }
     
     def execute(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
         """Execute a SATCOM operations task"""
         try:
-            task_lower = task.lower()
-            
-            if "link budget" in task_lower:
-                if context:
-                    result = self.calculate_link_budget(
-                        context.get("frequency_ghz", 14.25),
-                        context.get("distance_km", 36000),
-                        context.get("tx_power_dbm", 30),
-                        context.get("tx_gain_dbi", 45),
-                        context.get("rx_gain_dbi", 35),
-                        context.get("rain_margin_db", 3)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide link parameters (frequency, distance, power, gains)"
-            
-            elif "orbital coverage" in task_lower or "coverage analysis" in task_lower:
-                if context:
-                    result = self.analyze_orbital_coverage(
-                        context.get("altitude_km", 550),
-                        context.get("inclination", 53),
-                        context.get("lat", 40),
-                        context.get("lon", -74),
-                        context.get("min_elevation", 10)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide orbital parameters and ground station location"
-            
-            elif "frequency" in task_lower and "coordination" in task_lower:
-                if context:
-                    result = self.frequency_coordination_analysis(
-                        context.get("frequency_mhz", 3750),
-                        context.get("bandwidth_mhz", 36),
-                        context.get("service_type", "FSS")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide frequency parameters for coordination analysis"
-            
-            elif "modulation" in task_lower or "modcod" in task_lower:
-                if context:
-                    result = self.modulation_coding_optimization(
-                        context.get("link_margin_db", 6),
-                        context.get("bandwidth_mhz", 36),
-                        context.get("throughput_mbps", 100)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide link margin and throughput requirements"
-            
-            elif "availability" in task_lower:
-                if context:
-                    result = self.ground_station_availability(
-                        context.get("location", {"lat": 40, "lon": -74}),
-                        context.get("frequency_band", "Ku-band"),
-                        context.get("redundancy", "1+1")
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide location and redundancy configuration"
-            
-            elif "interference" in task_lower:
-                if context:
-                    result = self.interference_mitigation_strategy(
-                        context.get("type", "adjacent_channel"),
-                        context.get("frequency_mhz", 3750),
-                        context.get("level_db", 8)
-                    )
-                    return json.dumps(result, indent=2)
-                else:
-                    return "Please provide interference type and level"
+            intent = _classify_task(task.lower())
             
             # For general queries or context-aware responses, use the base LLM execution  
-            else:
+            if intent is None:
                 # Add SATCOM-specific context
                 enhanced_context = context.copy() if context else {}
                 enhanced_context.update({
@@ -595,6 +926,24 @@ class SATCOMExpertAgent(BaseCrewAgent):
                 
                 # Use parent class LLM execution for natural language response
                 return super().execute(task, enhanced_context)
+            
+            method_name, extract, missing_message = TASK_DISPATCH[intent]
+            if not context:
+                return missing_message
+            result = getattr(self, method_name)(*extract(context))
+            return serialize_result(result)
                 
-        except Exception as e:
-            return f"I apologize for the technical difficulty. As your SATCOM Operations Expert, I specialize in satellite communication systems, link budgets, orbital mechanics, and RF performance optimization. I can help you analyze coverage patterns, optimize signal quality, and resolve interference issues. What specific SATCOM analysis would you like me to perform?"
\ No newline at end of file
+        except Exception:
+            return ANALYSIS_ERROR_REPLY
+    
+    async def aexecute(self, task: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """Execute a SATCOM operations task on a worker thread, keeping the event loop free"""
+        return await asyncio.to_thread(self.execute, task, context)
+    
+    async def aexecute_batch(self, items: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[str]:
+        """Execute several SATCOM tasks concurrently, returning one reply per (task, context) pair in order
+        
+        Tasks run on the event loop's default executor, so the analyses and LLM
+        calls of a batch overlap up to its worker limit.
+        """
+        return list(await asyncio.gather(*(asyncio.to_thread(self.execute, task, context) for task, context in items)))
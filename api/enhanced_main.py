@@ -2,7 +2,7 @@
 Enhanced FastAPI backend for CrewAI agents with specialized domain expertise
 """
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import Dict, Any, Optional, List
@@ -13,6 +13,7 @@ import asyncio
 import logging
 
 # Import specialized agents
+from agents.base_agent import FallbackReply
 from agents.geospatial_analyst import GeospatialAnalystAgent
 from agents.satcom_expert import SATCOMExpertAgent
 from agents.network_optimizer import NetworkOptimizerAgent
@@ -29,6 +30,8 @@ from crews.specialized_crews import (
     EmergencyResponseCrew
 )
 
+from llm_cache import LLMCache, SemanticCache, normalize_prompt
+
 # Load environment variables
 load_dotenv()
 
@@ -66,6 +69,33 @@ agents = {
 # Initialize crew orchestrator
 crew_orchestrator = CrewOrchestrator()
 
+# Cache of chat and analysis responses, shared across workers when Redis is configured
+llm_cache = LLMCache(
+    redis_url=os.getenv("REDIS_URL"),
+    ttl_seconds=int(os.getenv("LLM_CACHE_TTL", 3600))
+)
+
+# Embedding-similarity cache so reworded chat prompts share an answer
+semantic_cache = SemanticCache(
+    data_dir=os.getenv("SEMANTIC_CACHE_DIR", "semantic_cache"),
+    similarity_threshold=float(os.getenv("SEMANTIC_CACHE_THRESHOLD", 0.8)),
+    ttl_seconds=llm_cache.ttl_seconds
+)
+
+# Background warmup task; held here because the event loop only keeps weak references to tasks
+warmup_task: Optional[asyncio.Task] = None
+
+def _log_warmup_failure(task: asyncio.Task):
+    if not task.cancelled() and task.exception() is not None:
+        logger.error(f"Agent warmup failed: {task.exception()}")
+
+@app.on_event("startup")
+async def warmup_agents():
+    """Load optional numeric modules in the background once the server is up"""
+    global warmup_task
+    warmup_task = asyncio.create_task(asyncio.to_thread(GeospatialAnalystAgent.warmup))
+    warmup_task.add_done_callback(_log_warmup_failure)
+
 # WebSocket connection manager
 class ConnectionManager:
     def __init__(self):
@@ -135,7 +165,7 @@ async def health_check():
     }
 
 @app.post("/chat")
-async def chat(request: ChatRequest):
+async def chat(request: ChatRequest, response: Response):
     """Main chat endpoint with intelligent agent routing"""
     try:
         message = request.message.lower()
@@ -162,25 +192,53 @@ async def chat(request: ChatRequest):
             agent = agents["business"]
             agent_name = "business"
         
-        # Execute agent task
-        result = agent.execute(request.message, context)
+        # Repeated questions to the same agent reuse the cached answer
+        prompt = normalize_prompt(request.message)
+        key = llm_cache.make_key(agent_name, prompt, context)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            cached["metadata"]["session_id"] = request.session_id
+            response.headers["X-Cache"] = "HIT"
+            return ChatResponse(**cached)
         
-        # Check if result contains actions (JSON with response and actions)
-        actions = []
-        response_text = result
+        # Reworded questions share an answer, unless they carry context data or
+        # name a place to show, where similar wording can mean a different location
+        use_semantic = (semantic_cache.enabled and not context
+                        and not agent.detect_location_intent(request.message))
+        hit = None
+        failed = False
+        if use_semantic:
+            hit = await asyncio.to_thread(semantic_cache.get, prompt, agent_name)
         
-        try:
-            # Try to parse result as JSON in case agent returns structured response
-            if isinstance(result, str) and result.strip().startswith('{'):
-                parsed_result = json.loads(result)
-                if 'response' in parsed_result:
-                    response_text = parsed_result['response']
-                    actions = parsed_result.get('actions', [])
-        except:
-            # If not JSON, use result as plain text response
+        if hit is not None:
+            response_text, actions = hit
+        else:
+            # Execute agent task
+            result = agent.execute(request.message, context)
+            
+            # Canned replies stand in for a failed analysis or LLM call and are never cached
+            failed = isinstance(result, FallbackReply)
+            
+            # Check if result contains actions (JSON with response and actions)
+            actions = []
             response_text = result
+            
+            try:
+                # Try to parse result as JSON in case agent returns structured response
+                if isinstance(result, str) and result.strip().startswith('{'):
+                    parsed_result = json.loads(result)
+                    if 'response' in parsed_result:
+                        response_text = parsed_result['response']
+                        actions = parsed_result.get('actions', [])
+            except:
+                # If not JSON, use result as plain text response
+                response_text = result
+            
+            # Map actions target one specific place, so only plain answers are shared
+            if use_semantic and not failed and not actions:
+                await asyncio.to_thread(semantic_cache.put, prompt, agent_name, response_text, actions)
         
-        return ChatResponse(
+        reply = ChatResponse(
             response=response_text,
             agent_used=agent_name,
             confidence=0.85,
@@ -190,18 +248,27 @@ async def chat(request: ChatRequest):
                 "context_used": bool(context)
             }
         )
+        if not failed:
+            await llm_cache.set(key, reply.dict())
+        response.headers["X-Cache"] = "MISS" if hit is None else "HIT"
+        return reply
         
     except Exception as e:
         logger.error(f"Chat error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/geospatial")
-async def analyze_geospatial(request: Dict[str, Any]):
+async def analyze_geospatial(request: Dict[str, Any], response: Response):
     """Geospatial analysis endpoint"""
     try:
         agent = agents["geospatial"]
         
         analysis_type = request.get("type", "coverage")
+        key = llm_cache.make_key("geospatial", analysis_type, request)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
         
         if analysis_type == "coverage":
             result = agent.analyze_coverage_gaps(
@@ -222,20 +289,30 @@ async def analyze_geospatial(request: Dict[str, Any]):
             )
         else:
             result = {"error": "Unknown analysis type"}
+            # Only recognised analyses are cached
+            key = None
         
-        return {"status": "success", "result": result}
+        payload = {"status": "success", "result": result}
+        await llm_cache.set(key, payload)
+        response.headers["X-Cache"] = "MISS"
+        return payload
         
     except Exception as e:
         logger.error(f"Geospatial analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/satcom")
-async def analyze_satcom(request: Dict[str, Any]):
+async def analyze_satcom(request: Dict[str, Any], response: Response):
     """SATCOM analysis endpoint"""
     try:
         agent = agents["satcom"]
         
         analysis_type = request.get("type", "link_budget")
+        key = llm_cache.make_key("satcom", analysis_type, request)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
         
         if analysis_type == "link_budget":
             result = agent.calculate_link_budget(
@@ -262,20 +339,33 @@ async def analyze_satcom(request: Dict[str, Any]):
             )
         else:
             result = {"error": "Unknown analysis type"}
+            # Only recognised analyses are cached
+            key = None
         
-        return {"status": "success", "result": result}
+        payload = {"status": "success", "result": result}
+        await llm_cache.set(key, payload)
+        response.headers["X-Cache"] = "MISS"
+        return payload
         
     except Exception as e:
         logger.error(f"SATCOM analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/network")
-async def analyze_network(request: Dict[str, Any]):
+async def analyze_network(request: Dict[str, Any], response: Response):
     """Network optimization analysis endpoint"""
     try:
         agent = agents["network"]
         
         analysis_type = request.get("type", "topology")
+        # Topology without a traffic matrix draws fresh synthetic traffic on every call
+        key = None
+        if analysis_type != "topology" or request.get("traffic_matrix"):
+            key = llm_cache.make_key("network", analysis_type, request)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
         
         if analysis_type == "topology":
             result = agent.optimize_network_topology(
@@ -295,20 +385,30 @@ async def analyze_network(request: Dict[str, Any]):
             )
         else:
             result = {"error": "Unknown analysis type"}
+            # Only recognised analyses are cached
+            key = None
         
-        return {"status": "success", "result": result}
+        payload = {"status": "success", "result": result}
+        await llm_cache.set(key, payload)
+        response.headers["X-Cache"] = "MISS"
+        return payload
         
     except Exception as e:
         logger.error(f"Network analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/business")
-async def analyze_business(request: Dict[str, Any]):
+async def analyze_business(request: Dict[str, Any], response: Response):
     """Business intelligence analysis endpoint"""
     try:
         agent = agents["business"]
         
         analysis_type = request.get("type", "market")
+        key = llm_cache.make_key("business", analysis_type, request)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
         
         if analysis_type == "market":
             result = agent.market_analysis(
@@ -332,20 +432,33 @@ async def analyze_business(request: Dict[str, Any]):
             )
         else:
             result = {"error": "Unknown analysis type"}
+            # Only recognised analyses are cached
+            key = None
         
-        return {"status": "success", "result": result}
+        payload = {"status": "success", "result": result}
+        await llm_cache.set(key, payload)
+        response.headers["X-Cache"] = "MISS"
+        return payload
         
     except Exception as e:
         logger.error(f"Business analysis error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/analyze/regulatory")
-async def analyze_regulatory(request: Dict[str, Any]):
+async def analyze_regulatory(request: Dict[str, Any], response: Response):
     """Regulatory compliance analysis endpoint"""
     try:
         agent = agents["regulatory"]
         
         analysis_type = request.get("type", "licensing")
+        # An audit is dated and counts days to license expiry from today
+        key = None
+        if analysis_type != "compliance_audit":
+            key = llm_cache.make_key("regulatory", analysis_type, request)
+        cached = await llm_cache.get(key)
+        if cached is not None:
+            response.headers["X-Cache"] = "HIT"
+            return cached
         
         if analysis_type == "licensing":
             result = agent.licensing_requirements_analysis(
@@ -369,8 +482,13 @@ async def analyze_regulatory(request: Dict[str, Any]):
             )
         else:
             result = {"error": "Unknown analysis type"}
+            # Only recognised analyses are cached
+            key = None
         
-        return {"status": "success", "result": result}
+        payload = {"status": "success", "result": result}
+        await llm_cache.set(key, payload)
+        response.headers["X-Cache"] = "MISS"
+        return payload
         
     except Exception as e:
         logger.error(f"Regulatory analysis error: {str(e)}")
@@ -418,7 +536,7 @@ async def websocket_chat(websocket: WebSocket):
             
             # Process with appropriate agent
             request = ChatRequest(**message_data)
-            response = await chat(request)
+            response = await chat(request, Response())
             
             # Send response back to client
             await manager.send_personal_message(
@@ -0,0 +1,196 @@
+"""
+Response caches for the agent endpoints
+Repeated chat and analysis requests are answered from Redis, or an in-process LRU, without invoking the agents;
+reworded chat prompts are matched by embedding similarity when GPTCache is installed
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+
+try:
+    import redis.asyncio as aioredis
+    from redis.exceptions import RedisError
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+try:
+    from gptcache import Cache, Config
+    from gptcache.adapter.api import init_similar_cache, get as gptcache_get, put as gptcache_put
+    from gptcache.embedding import Onnx
+    HAS_GPTCACHE = True
+except ImportError:
+    HAS_GPTCACHE = False
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 1024
+KEY_PREFIX = "llm-cache:"
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+def normalize_prompt(message: str) -> str:
+    """Lower-case a prompt and collapse its whitespace so trivially different wordings share a key"""
+    return " ".join(message.lower().split())
+
+class LLMCache:
+    """TTL cache of JSON responses keyed by (agent, prompt, context)
+
+    Backed by Redis when a URL is given and redis-py is installed, otherwise by
+    an in-process LRU bounded to max_entries. Values are stored as JSON text,
+    so every hit returns a fresh copy. Redis failures are logged and treated as
+    misses; the cache never fails a request.
+    """
+
+    def __init__(self, redis_url: Optional[str] = None,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS,
+                 max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._redis = None
+        # key -> (expiry on the monotonic clock, JSON text)
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+        if redis_url and HAS_REDIS:
+            self._redis = aioredis.from_url(redis_url, socket_timeout=1)
+            logger.info("LLM response cache backed by Redis")
+        elif redis_url:
+            logger.warning("redis is not installed; LLM response cache falling back to memory")
+
+    @staticmethod
+    def make_key(agent: str, message: str, context: Any = None) -> Optional[str]:
+        """Stable key for a request, or None if the context isn't JSON data"""
+        try:
+            canonical = json.dumps(
+                {"agent": agent, "message": message, "context": context},
+                sort_keys=True, separators=(",", ":")
+            )
+        except (TypeError, ValueError):
+            return None
+        return KEY_PREFIX + hashlib.sha256(canonical.encode()).hexdigest()
+
+    async def get(self, key: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Cached response for key, or None on a miss"""
+        if key is None:
+            return None
+
+        if self._redis is not None:
+            try:
+                text = await self._redis.get(key)
+            except (RedisError, OSError) as e:
+                logger.warning(f"LLM cache read failed: {e}")
+                return None
+            return json.loads(text) if text is not None else None
+
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires, text = entry
+        if expires <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return json.loads(text)
+
+    async def set(self, key: Optional[str], value: Dict[str, Any]) -> None:
+        """Store a response under key; values that aren't JSON data are skipped"""
+        if key is None:
+            return
+        try:
+            text = json.dumps(value, separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+
+        if self._redis is not None:
+            try:
+                await self._redis.set(key, text, ex=self.ttl_seconds)
+            except (RedisError, OSError) as e:
+                logger.warning(f"LLM cache write failed: {e}")
+            return
+
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, text)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+class SemanticCache:
+    """Chat answers matched by prompt embedding similarity, one GPTCache index per agent
+
+    Only used for prompts sent without request context, since the same
+    question about different data needs a different answer. Lookups embed the
+    prompt and search the vector index, so callers should run them off the
+    event loop. Without GPTCache installed every lookup is a miss. Indexes are
+    created on first use and share a single ONNX embedding model.
+
+    The indexes persist on disk with no expiry of their own, so each answer is
+    stored with its wall-clock time and entries older than ttl_seconds, or
+    that fail to decode, count as misses.
+    """
+
+    def __init__(self, data_dir: str = "semantic_cache",
+                 similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                 ttl_seconds: int = DEFAULT_TTL_SECONDS):
+        self.data_dir = data_dir
+        self.similarity_threshold = similarity_threshold
+        self.ttl_seconds = ttl_seconds
+        self._embedding = None
+        self._caches: Dict[str, "Cache"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return HAS_GPTCACHE
+
+    def _cache_for(self, agent: str) -> "Cache":
+        """GPTCache index for an agent, created on first use"""
+        with self._lock:
+            cache_obj = self._caches.get(agent)
+            if cache_obj is None:
+                if self._embedding is None:
+                    self._embedding = Onnx()
+                cache_obj = Cache()
+                init_similar_cache(
+                    data_dir=os.path.join(self.data_dir, agent),
+                    cache_obj=cache_obj,
+                    embedding=self._embedding,
+                    config=Config(similarity_threshold=self.similarity_threshold)
+                )
+                self._caches[agent] = cache_obj
+            return cache_obj
+
+    def get(self, message: str, agent_hint: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """(response text, actions) cached for a similar prompt to the same agent, or None on a miss"""
+        if not HAS_GPTCACHE:
+            return None
+        try:
+            answer = gptcache_get(message, cache_obj=self._cache_for(agent_hint))
+            if answer is None:
+                return None
+            stored_at, response_text, actions = json.loads(answer)
+            expired = time.time() - stored_at > self.ttl_seconds
+        except Exception as e:
+            logger.warning(f"Semantic cache read failed: {e}")
+            return None
+        if expired:
+            return None
+        return response_text, actions
+
+    def put(self, message: str, agent_hint: str, response_text: str,
+            actions: List[Dict[str, Any]]) -> None:
+        """Store an agent's answer under the prompt's embedding; answers that aren't JSON data are skipped"""
+        if not HAS_GPTCACHE:
+            return
+        try:
+            answer = json.dumps([time.time(), response_text, actions], separators=(",", ":"))
+        except (TypeError, ValueError):
+            return
+        try:
+            gptcache_put(message, answer, cache_obj=self._cache_for(agent_hint))
+        except Exception as e:
+            logger.warning(f"Semantic cache write failed: {e}")
@@ -0,0 +1,33 @@
+"""
+Regression checks for NetworkOptimizerAgent.execute response caching
+"""
+
+import pytest
+
+pytest.importorskip("crewai")
+pytest.importorskip("langchain_community")
+
+from api.agents.network_optimizer import NetworkOptimizerAgent
+
+STATIONS = [
+    {
+        "name": f"GS-{i}",
+        "location": {"latitude": 10.0 + 4 * i, "longitude": -80.0 + 7 * i},
+        "utilization_metrics": {"current_utilization": 30 + 12 * i},
+        "capacity_metrics": {"total_capacity_gbps": 10 + i}
+    }
+    for i in range(5)
+]
+
+def test_synthetic_topology_is_not_cached():
+    agent = NetworkOptimizerAgent()
+    first = agent.execute("optimize topology", {"stations": STATIONS})
+    second = agent.execute("optimize topology", {"stations": STATIONS})
+    assert first is not second
+
+def test_topology_with_traffic_matrix_is_cached():
+    agent = NetworkOptimizerAgent()
+    context = {"stations": STATIONS, "traffic_matrix": {"GS-0->GS-1": 1.5, "GS-2->GS-3": 0.4}}
+    first = agent.execute("optimize topology", context)
+    second = agent.execute("optimize topology", context)
+    assert first is second